@@ -2,169 +2,174 @@
 #pip install pypdf requests
 #pip install beautifulsoup4
 
-import requests
-import io
-#import os
-#import sys
-import difflib
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from pypdf import PdfReader
-import PyPDF2
-
-#gets the pdf from the url
-def get_pdf_from_url(url: str, timeout: int = 30) -> bytes:
-
-    resp = requests.get(url, timeout=timeout, allow_redirects=True)
-    resp.raise_for_status()
-    return resp.content
-
-#parses through pdf and saves the text into a list
-def read_pdf_text(pdf_bytes: bytes) -> str:
-
-    if PdfReader is None:
-        raise ImportError(
-            "PDF library required. Install with: pip install pypdf"
-        )
-    
-    pdf_file = io.BytesIO(pdf_bytes)
-    reader = PdfReader(pdf_file)
-    
-    text_parts = []
-    for page in reader.pages:
-        text = page.extract_text()
-        text_parts.append(text)
-    
-    return '\n'.join(text_parts)
-
-
-
-#this function scrapes the pdf link from the page and returns the link as a string
-def find_pdf_url_on_page(page_url: str, link_text: str = 'Download the criteria') -> str:
-
-
-    
-    #scrapes the webpage
-    response = requests.get(page_url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, 'html.parser')
-    print("FDHSKJFLDS")
-
-
-    #dont think this is needed?
-    #download_link = soup.find('a', string=lambda text: text and link_text in text)
-    #print(download_link)
-    #if download_link and download_link.get('href'):
-    #    pdf_url = urljoin(page_url, download_link['href'])
-    #    return pdf_url
-    
-    getlink = 'Download the Criteria'
-    #scrapes link from the website
-
-    #pdf links are different from cs and cse in the html structure so this checks for href, getting all lowercase for string lambda bypasses weird navigation thing
-    button_link = soup.find("a", href=True, string=lambda s: s and getlink.lower() in s.lower())
-
-    #gets cs link
-    #soup.find('a', class_='button')
-    print(button_link)
-    #button_link = soup.find('a', string= link_text)
-   
-    if button_link and button_link.get('href'):
-        pdf_url = urljoin(page_url, button_link['href'])
-        
-       
-        return pdf_url
-    
-    raise ValueError(f"Could not find PDF download link on page: {page_url}")
-
-#this function scrapes the pdf from the ABET page and extracts the text and returns it as a string
-def scrape_pdf_from_page(page_url: str, link_text: str = 'Download the Criteria', 
-                          save_pdf: str = None) -> str:
-
-    # Find the PDF URL
-    print(f"Searching for PDF link onn {page_url}")
-    pdf_url = find_pdf_url_on_page(page_url, link_text)
-    print(f"Found PDF: {pdf_url}")
-    
-    # Download the PDF
-    print("Downloading PDF")
-    pdf_bytes = get_pdf_from_url(pdf_url)
-    
-    #save the PDF
-    if save_pdf:
-        with open(save_pdf, 'wb') as f:
-            f.write(pdf_bytes)
-        print(f"PDF saved to {save_pdf}")
-    
-    # Extract text
-    print("getting text")
-    text = read_pdf_text(pdf_bytes)
-    
-    return text
-
-#not needed? since already being used in email code?
-#min diff function for comparing two txt files and showing the changes
-"""def mindiff_text_files(path_a: str, path_b: str, out_path: str = None, context: int = 3) -> str:
-
-    if not os.path.exists(path_a):
-        raise ValueError(f'File not found: {path_a}')
-    if not os.path.exists(path_b):
-        raise ValueError(f'File not found: {path_b}')
-
-    with open(path_a, 'r', encoding='utf-8', errors='replace') as fa:
-        a_lines = fa.read().splitlines()
-    with open(path_b, 'r', encoding='utf-8', errors='replace') as fb:
-        b_lines = fb.read().splitlines()
-
-    if out_path is None:
-        a_base = os.path.splitext(os.path.basename(path_a))[0]
-        b_base = os.path.splitext(os.path.basename(path_b))[0]
-        out_name = f"{a_base}+{b_base}_diff.txt"
-        out_path = os.path.join(os.path.dirname(path_a) or '.', out_name)
-
-    diff_lines = list(difflib.unified_diff(a_lines, b_lines,
-                                           fromfile=path_a,
-                                           tofile=path_b,
-                                           n=context,
-                                           lineterm=''))
-
-    with open(out_path, 'w', encoding='utf-8') as out_f:
-        if not diff_lines:
-            out_f.write('')
-        else:
-            out_f.write('\n'.join(diff_lines))
-
-    return out_path
-"""
-
-if __name__ == '__main__':
-
-
-    CS_url = "https://www.abet.org/accreditation/accreditation-criteria/criteria-for-accrediting-computing-programs-2025-2026/"
-    CS_text = "cs_criteria.txt"
-    CSE_url = "https://www.abet.org/accreditation/accreditation-criteria/criteria-for-accrediting-engineering-programs-2025-2026/"
-    CSE_text = "cse_criteria.txt"
-    save_pdf = ""
-
-
-    #scrape cs pdf into txt file
-    print(f"Scraping PDF from webpage: {CS_url}")
-    text = scrape_pdf_from_page(CS_url, save_pdf)
-
-    with open(CS_text, 'w', encoding='utf-8') as f:
-        f.write(text)
-    print(f"Text saved to {CS_text}")
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+#the scraping/extraction logic lives in src/_abet_core.py, shared with src/abet_scraper.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from _abet_core import (
+    PDF_CACHE_DIR,
+    _cached_pdf_exists,
+    _ensure_dir,
+    _read_cached_pdf,
+    _write_cached_pdf,
+    download_pdf_to_path,
+    find_pdf_url_on_page,
+    get_pdf_from_url,
+    mindiff_text_files,
+    read_pdf_file,
+    read_pdf_text,
+    read_pdf_text_cached,
+    scrape_pdf_from_page,
+    should_refetch,
+)
+
+#orjson serializes in C, several times faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#aiohttp lets the pdf downloads overlap instead of waiting on each response in turn
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+#one criteria page to scrape and the txt file its text lands in
+@dataclass(frozen=True, slots=True)
+class PdfSpec:
+    name: str
+    url: str
+    text_file: str
+
+#the pages scraped by default, frozen so nothing rebuilds them per run
+DEFAULT_PAGES = (
+    PdfSpec(
+        "CS_Criteria",
+        "https://www.abet.org/accreditation/accreditation-criteria/criteria-for-accrediting-computing-programs-2025-2026/",
+        "cs_criteria.txt",
+    ),
+    PdfSpec(
+        "CSE_Criteria",
+        "https://www.abet.org/accreditation/accreditation-criteria/criteria-for-accrediting-engineering-programs-2025-2026/",
+        "cse_criteria.txt",
+    ),
+)
+
+
+#downloads one pdf inside the shared aiohttp session, through the same conditional-get
+#cache as get_pdf_from_url - without this the aiohttp path (the default once aiohttp is
+#installed) refetched the full body every run and the .pdf_cache validators never ran
+async def _fetch_pdf_async(session, url: str) -> bytes:
+    _ensure_dir(PDF_CACHE_DIR)
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    meta_path = os.path.join(PDF_CACHE_DIR, f"{key}.meta.json")
+    pdf_path = os.path.join(PDF_CACHE_DIR, f"{key}.pdf")
+
+    #replay the stored validators so an unchanged pdf answers 304 with no body
+    headers = {}
+    if os.path.exists(meta_path) and _cached_pdf_exists(pdf_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        except Exception:
+            pass
+
+    async with session.get(url, allow_redirects=True, headers=headers) as resp:
+        if resp.status == 304:
+            print("PDF unchanged on server, using cached copy")
+            return _read_cached_pdf(pdf_path)
+
+        resp.raise_for_status()
+        body = await resp.read()
+
+        #remember the new body plus validators for the next run, zstd-compressed on
+        #disk when the library is around, same as the sync path
+        _write_cached_pdf(pdf_path, body)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'content_length': resp.headers.get('Content-Length'),
+            }, f)
+        return body
+
+#downloads all pdfs concurrently in one aiohttp session
+async def _fetch_pdfs_async(urls):
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(*(_fetch_pdf_async(session, url) for url in urls))
+
+#fetches every pdf, overlapping the network waits when aiohttp is installed
+def fetch_pdfs(urls) -> list:
+
+    if aiohttp is not None:
+        return asyncio.run(_fetch_pdfs_async(urls))
+
+    #fallback: sequential download over the pooled session
+    return [get_pdf_from_url(url) for url in urls]
+
+
+#records what each run produced in a jsonl manifest next to the txt files
+def write_run_manifest(records: list, run_ts: str) -> str:
+
+    manifest_path = f"run_{run_ts}.jsonl"
+    with open(manifest_path, 'wb') as f:
+        for rec in records:
+            if orjson is not None:
+                f.write(orjson.dumps(rec))
+            else:
+                f.write(json.dumps(rec).encode('utf-8'))
+            f.write(b'\n')
+    return manifest_path
 
 
+if __name__ == '__main__':
 
-    #scrape cse pdf into txt file
-    print(f"Scraping PDF from webpage: {CSE_url}")
-    text = scrape_pdf_from_page(CSE_url, save_pdf)
 
-    with open(CSE_text, 'w', encoding='utf-8') as f:
-        f.write(text)
-    print(f"Text saved to {CS_text}")
-   
+    run_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
 
+    #find both pdf links first so the downloads can run together
+    pdf_urls = []
+    for spec in DEFAULT_PAGES:
+        print(f"Scraping PDF from webpage: {spec.url}")
+        pdf_urls.append(find_pdf_url_on_page(spec.url))
 
+    #download both pdfs at once
+    print("Downloading PDFs")
+    pdf_blobs = fetch_pdfs(pdf_urls)
 
+    #extraction is cpu bound so parse the pdfs on separate cores
+    print("getting text")
+    with ProcessPoolExecutor(max_workers=min(len(pdf_blobs), os.cpu_count() or 1)) as pool:
+        texts = list(pool.map(read_pdf_text_cached, pdf_blobs))
+
+    #save each text into its txt file, keeping the txt outputs since email_auto diffs them
+    manifest_records = []
+    for spec, pdf_url, text in zip(DEFAULT_PAGES, pdf_urls, texts):
+        with open(spec.text_file, 'wb') as f:
+            f.write(text.encode('utf-8'))
+        print(f"Text saved to {spec.text_file}")
+        manifest_records.append({
+            'run_ts': run_ts,
+            'name': spec.name,
+            'page_url': spec.url,
+            'pdf_url': pdf_url,
+            'text_file': spec.text_file,
+            'chars': len(text),
+        })
+
+    manifest_path = write_run_manifest(manifest_records, run_ts)
+    print(f"Run manifest saved to {manifest_path}")
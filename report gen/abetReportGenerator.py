@@ -1,808 +1,995 @@
-"""
-abetReportGenerator-template_embed.py
-------------------------------------
-ABET Assessment Report Generator
-
-- Reads Canvas JSON data from input_jsons/*.json
-- Writes DOCX reports to generated_pdfs/<json_stem>_ABET_Report.docx
-- Uses embedded DOCX template (Base64) written once to generated_pdfs/_ABET_TEMPLATE.docx
-- Uses OpenAI ONLY to fill the final "changes needed..." tail when outcome was not met
-- Preserves template formatting by replacing text inside existing template paragraphs AND table cells
-
-IMPORTANT:
-- Put your template DOCX Base64 into TEMPLATE_DOCX_B64.
-"""
-
-import os
-import json
-import csv
-import time
-import re
-import html
-import base64
-from glob import glob
-from pathlib import Path
-from typing import Optional, Dict, Any, Iterable, Tuple
-
-from docx import Document  # python-docx
-from docx.oxml import OxmlElement
-from docx.text.paragraph import Paragraph
-from dotenv import load_dotenv
-from openai import OpenAI
-
-
-# CONFIG
-load_dotenv()
-
-json_input_glob = "input_jsons/*.json"
-out_dir = "generated_pdfs"
-os.makedirs(out_dir, exist_ok=True)
-
-output_csv = "ABETReportSummary.csv"
-template_path = os.path.join(out_dir, "_ABET_TEMPLATE.docx")
-
-OPENAI_MODEL = "gpt-5.2"
-
-prompt_base = (
-    "You are an education assessment expert writing ABET assessment report feedback. "
-    "Output ONLY the text that should follow the question: "
-    "'If outcome was not met, what changes need to be made to ensure that students can meet this outcome in the future?' "
-    "Do not add headings, labels, bullets, or extra lines. 1-3 sentences. Concise and actionable."
-)
-
-prompt_section2_base = (
-    "You are formatting ABET report section content for faculty. "
-    "Rewrite the provided assessment instrument content into clean, professional plain text with this layout: "
-    "intro paragraph, then Part headings and body paragraphs. "
-    "Preserve the original meaning and details; do not invent facts. "
-    "Remove artifacts like standalone page numbers and broken OCR spacing. "
-    "If source uses numbered questions, leave it as it is. "
-    "Output STRICT JSON only in this schema: "
-    '{"blocks":[{"intro":"<1 short paragraph>","parts":[{"heading":"<numbered questions>: <title>","body":"<paragraph>"}],"closing":"<optional closing paragraph>"}]}. '
-    "Each part body should be one concise paragraph."
-    "No markdown. No code fences."
-)
-
-# TEMPLATE BASE64: Template by prof encoded in base64
-TEMPLATE_DOCX_B64 = r'''UEsDBBQABgAIAAAAIQDkJIlMfQEAACkGAAATAAgCW0NvbnRlbnRfVHlwZXNdLnhtbCCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC0lMtqwzAQRfeF/oPRtsRKuiilxMmij2UbaArdKvI4EdULaZzH33fsJKYUJy5NsjHIM/feowHNcLw2OllCiMrZjA3SPkvASpcrO8/Yx/Sld8+SiMLmQjsLGdtAZOPR9dVwuvEQE1LbmLEFon/gPMoFGBFT58FSpXDBCKRjmHMv5JeYA7/t9++4dBbBYg8rDzYaPkEhSo3J85p+b0kC6MiSx21jlZUx4b1WUiDV+dLmv1J6u4SUlHVPXCgfb6iB8daEqnI4YKd7o9EElUMyEQFfhaEuvnIh57mTpSFletymhdMVhZLQ6Cs3H5yEGGnmRqdNxQhl9/xtHLKM6Myn0VwhmElwPg5OxmlMKz8IqKCZ4cFZ2NLMIBD9+YfRWHdCRNxoiOcn2Pp2xwMiCS4BsHPuRFjB7P1iFD/MO0EKyp2KmYbzYzTWnRBIqwi239NfRW1zLJI66wdIqy3849r73VWpe/5PL69JJOuT7wfVWswhb8nm9aIffQMAAP//AwBQSwMEFAAGAAgAAAAhAB6RGrfvAAAATgIAAAsACAJfcmVscy8ucmVscyCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsksFqwzAMQO+D/YPRvVHawRijTi9j0NsY2QcIW0lME9vYatf+/TzY2AJd6WFHy9LTk9B6c5xGdeCUXfAallUNir0J1vlew1v7vHgAlYW8pTF41nDiDJvm9mb9yiNJKcqDi1kVis8aBpH4iJjNwBPlKkT25acLaSIpz9RjJLOjnnFV1/eYfjOgmTHV1mpIW3sHqj1FvoYdus4ZfgpmP7GXMy2Qj8Lesl3EVOqTuDKNain1LBpsMC8lnJFirAoa8LzR6nqjv6fFiYUsCaEJiS/7fGZcElr+54rmGT827yFZtF/hbxucXUHzAQAA//8DAFBLAwQUAAYACAAAACEAUMu/e1ALAACqPQAAEQAAAHdvcmQvZG9jdW1lbnQueG1s7Fvrb9s4Ev9+wP0PRBYF9oA01lu2sc1C1qObw+5e0PTuPtMSbesqiQJFxc3+9Tejhy35FcVp0nbvWsCS+PhxOJwZDoeTn37+nCbknoki5tm7C/VKuSAsC3kUZ8t3F//8GLwdX5BC0iyiCc/Yu4sHVlz8fP3Xv/y0nkY8LFOWSQIQWTFd5+G7i5WU+XQ0KsIVS2lxlcah4AVfyKuQpyO+WMQhG625iEaaoirVWy54yIoCxnNpdk+LiwYu/DwMLRJ0DZ0R0BiFKyok+7zFUJ8MYo4mo/E+kHYGEMxQU/eh9CdDWSOkag/IOAsIqNpDMs9DOjA56zwkbR/JPg9J30can4e0J07pvoDznGVQueAipRI+xXKUUvGpzN8CcE5lPI+TWD4ApmK1MDTOPp1BEfTaIKR69GQEe5TyiCV61KLwdxelyKZN/7eb/kj6tO7fPDY9WDJsWBhuMmKfZVLItq8Ywru6u9cYloprI8ES4CPPilWcb6xDei4aVK5akPtTDLhPk7bdOlcHqtox0+bVy7AFHEJ+s3ZpUlN+GlFVBqwmQmx6DCGhP2ZLSQoSvB34LNZ0mKsOND4tgLYHYIVs4GbRYowbjFG41W7EiQeqVYtTrwrixFvGqgNt4C4xHYCofBKEprd04AO7d7CKSEarp8G1azTCvlTSFS02SlMjLgYaghbR6CDWApbwcGPPEJM9jWnmBvAh7axhvnyeor4XvMy3aPHz0G62JnuNztMTsBqF7xqh4nnE3K1oDpY8Dac3y4wLOk+AIlBfAhpIqhXAXxBkfFSv7HNVjvLTvCwSfIlKgibx4hqcwDmPHvCZQ4UxzamgN6BDSmAoge6BM4mlsIVKLLUmE9dRZrARrqfgcEYfoCGIv2F6403RrcBCU7Fs09sUemxBy0TuN7/tNK6ouBX4KHIawoyhEV1IBojAT+ySxLgKml1RgB8fSmQCLSW/GGFHUfefw8eo+RptUKsfee0UBTC0cnw/sJwLSe5YiBsUUafkrkxh/3/AXrLGqBH2WWRMPEsHjvRZZDf/eiw6zo1+TcWNmaGaY6XLjROTOkyaPgkmljbbIU0xdNub2X6PtGa0/urtFHbo7dfs0nuMWuTlP0oJMs4IrbjPoh6H4adLlKGY6mxcQx5EQ5WqhAQWPxesYOKeXVyTAZj9iXYGktc/unc++UH720DKXoYImhFau5xEckLzPHmA89wSRJ0J1IiIFfEywzowDFEZMlLwpKzcKyJXVJKUMUmKnIXxImYRgX5RQdaxXJEQ2sQRE5UzRviC5OU8iUOyYjSRq0tS0AWTD5cEzopkzZIFFQw+CnxP8LlM+JwmlyQEWSgFvhU8jPHJsvtY8AxVCj8RgMFoHMwbWdBQclEMUCgtMDxQqB2bc1ChvpjUVkZjR68VXVesyaxPhqo7uurr6nPIMF1Dnz1D2U8rmHt3WvI0VddPqNS1v9v9yer3w0votK6oA2RHUSaqEVjOa8rOsEU7TK+lOophTXAf69BrmDPH8I3ghS20vP6NSRGHp5ZLVQwvMGujdGRlbrJCijqA9PEhZ4fE50jX6RAj2UhlUdAhu7Hpuoqrmjta++rGw5q41sycaU8nY/gSHiS85tZ7TpNiOkRfbN0ESXtVW/sI8UO208OT0XTFdkx/R5leTfnzO/mQgO89vadwqPo1LuQtELYUNF/VIpKVad0yTu6Ttl0jPlB3E7VlKpaNOh3O9oNh90U+lDS520Bsh21t0xnr8ZGTYsXXBKNjTLIsRIeBFLKM0A6kZQHOR8gF+HmSJIzC51Arc20rTzAhbwj4MHLFhsPXjieaq2NdDijU1QDxAxkztLGJrsH/xe+VxA9XnjcnihX4pnPGMnB95eVzxO2EHLxBfxkHbSS9aES9rwpDpEX39dlkZuIprOteGlYQeP5L7vxPZfUdTXOQqyL+g53erzXPCHy7YZT5BK4esfgti4dsY4FrGJ71qqp3YNe3x95EG7vf/m76gRUAXOys5xFB9QJPN8dI/tfkrW4GM8McuwPIaNT7wIj9mmrEji344oZUe31DWmvfXbX1RkC6iOdVVODgQst50jyas9c86c39I8YW34s4qomA6n9D1RpHhacEZ79LI1TfYMgAG9hap0n0mW5a/Mr5pw3thlO1WsSikB/4GncenD9tvraVLk/KFK+12/q2oGqS8V9mNEMzUH/9q/5qt7Hu9HAy+LqEJ2DUxKogVzWBvWJNsVvudnrKns3bCFT3CKLaY8110YafkNSPlXJ0d6Kw/m1oDRtWV8TtshJJahruGELdsX03wB5fW0vOlvW4EqKELZCYs8T/lokQY1DL/mG0FvuKdycYXi37YIabru44E22IdfwTM/z3Mp0zgb7RiU27YTw+6m6PapLi+YY1cR450L2QJjnmLNDdhqL/1YVVFeXNW1t58+J6BHuBbpvOTsBEV3xbGVtb3p5md+OBfr/sNsZfRG80G4oMy/gqeuPPTPg/JAjzJ9abGUvgRPgaimO5yti1nd2jj68EjmNhGHQIvwNHCwJ0rb9XfmuP6g0+and393gzM/VAPyNS+xpRm3ai9Yz21t4zLE33du53TVODcSb6c2g/YElfMuL01Q5KOwZ33Y9onGJa1f+RyEUdAo1ORk28iQEeew13IhY1iBwMTwlC5/yeYVhUlHMRh+THXcy67cR65lj9C/LDEqpbnqP5wc5ZyPBd1QmqrJJHRuxflXYltOHbn15C23yJNS0wsDmA59bMmLjeeGf3V4Kx6xtq/+J6h72P8XzQxfX3z/PDWn2z2ESacS0yjjkW8pKsMdsiXNFsyYoqzQKTMuaMpDRi+HpSy2xrYk4ahTp8c3qdFaVgdU7Hxq6EFKPcTEJxXGzIiuubkEUpocfPQ43OERv2uzNA1JSJ6YNEDDr99tPDTmeC6YoauH5Xqs5c+j11Op70pU1Jp3J7qT2ADbbrWdrssYhPxYadzJ8OG/o1FRs6N+BfmA0B7BOV7NAC84hwnpfkgZeEoqxxshaxZASkjOG9e5WCFEUgHAWmGy0wD5FnNCFQkmM2UZWpFIP8Y8oPymCcAqESAwJ4K1ICqdv8pKsh+0ZgzhzLx7l9Hxw9rEVg+SRmE/rA6xD4hew5zcABvMGkWVPXduy75ftjZaz3vb5vgjdVPJdlEQNX6JYu2Uww+qkyy/LaY0Uo4jnaN0bYYC6BXNFGspC+buMrQn6Bo1fEz4cEYe21jeLFAsoWgqcAyguGjTnAi15KXrdP0Te/RzZqT9MNOGZ9P2ajkmcwlDeVeg+5mbNdy5o5wZBwwDcyR7dJjyTtnW7ferWmLWc8T9glyRPQ+drwgQDkTMiHK7IV6zXvyOlOiuaK3reWErwGXgqy5iKJKiwcfM1IEt+zK4LWmtFwtQG4xPzPegRoOIrxThr9g6a6ugqv/A/aZGs2w2BO5jYls1vWzdzsVEQjPFBUCZ5sW3NF7sq82jwfkOowoXHaJJcKBqrCMmDJEDOvuGpgucYQ/+GbN/M6qEWGfxIBa/n3MloiL4fZc3c8Gc/sITmL34iKeGVl8OrFB4+Bidp5SMFVAJEEg5sAE8ocU3M4lH5iIK9hjKaxEf11nLTCVFvSoqM0KPsIt+YlaEPVPW45+5+Ws1dko6gJW2K6cc9mV7nHjfHPgdowBm0dJJN2oDmmZe0GhCx3YvneTkDtMZ/2y/H+iOiMHd/1nSHXfY+KzpentQDP+lYcJwI9byydOGqbk5wv7/4gddRZ06q0xOkK3s2x0SYFLH+jCCl5jpHpuomIlyu5/ZxzKXm6/a4Di+3XioFhFJsr6gXn1RSbz2Upq89NGDIBw9ZqPLapiiMe4n1ww4XbWIYrjHW0p8l64tVr/Wc1o+0fWV//FwAA//8DAFBLAwQUAAYACAAAACEA1+YInhsBAABEBAAAHAAIAXdvcmQvX3JlbHMvZG9jdW1lbnQueG1sLnJlbHMgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsk81OwzAQhO9IvIO1d+KkQEGoTi8IqVcIElc32fyI2I7sDZC3x6Jqkooq6sHHHWtnPnu9m+2PatkXWtcYLSCJYmCoc1M0uhLwnr3cPAJzJHUhW6NRwIAOtun11eYVW0m+ydVN55h30U5ATdQ9ce7yGpV0kelQ+5PSWCXJl7bincw/ZYV8FcdrbucekJ54sl0hwO6KW2DZ0OEl3qYsmxyfTd4r1HQmgjsaWn8BlklbIQk41JH3AX4+/iFkPPlenNL/yoOYLDGsQjLoXu3R+vFOHKO0BJGEhMh7R0Z9+LQRIoomlTeEavFJ1iFpSqMpk/t2NppRWoK4Dwnxjfs3JPJTmP3PmbgEchd0R/5RHJUjAj/Z/fQXAAD//wMAUEsDBBQABgAIAAAAIQCWta3i8QUAAFAbAAAVAAAAd29yZC90aGVtZS90aGVtZTEueG1s7FlLbxNHHL9X6ncY7R38iB2SCAfFjg0tBKLEUHEc7453B8/urGbGCb5VcKxUqSqteihSbz1UbZFA6oV+mrRULZX4Cv3P7Hq9Y4/BkFSlAh+88/j934+dsS9euhszdESEpDxpebXzVQ+RxOcBTcKWd7PfO7fhIalwEmDGE9LyJkR6l7Y//OAi3lIRiQkC+kRu4ZYXKZVuVSrSh2Usz/OUJLA35CLGCqYirAQCHwPfmFXq1ep6JcY08VCCY2B7YzikPkF9zdLbnjLvMvhKlNQLPhOHmjWxKAw2GNX0Q05khwl0hFnLAzkBP+6Tu8pDDEsFGy2vaj5eZftipSBiagltia5nPjldThCM6oZOhIOCsNZrbF7YLfgbAFOLuG632+nWCn4GgH0fLM10KWMbvY1ae8qzBMqGi7w71Wa1YeNL/NcW8Jvtdru5aeENKBs2FvAb1fXGTt3CG1A2bC7q397pdNYtvAFlw/UFfO/C5nrDxhtQxGgyWkDreBaRKSBDzq444RsA35gmwAxVKWVXRp+oZbkW4ztc9ABggosVTZCapGSIfcB1cDwQFGsBeIvg0k625MuFJS0LSV/QVLW8j1MMFTGDvHj644unj9HJvScn9345uX//5N7PDqorOAnLVM+//+Lvh5+ivx5/9/zBV268LON//+mz33790g1UZeCzrx/98eTRs28+//OHBw74jsCDMrxPYyLRdXKMDngMhjkEkIF4PYp+hGmZYicJJU6wpnGguyqy0NcnmOXRsXBtYnvwloAW4AJeHt+xFD6MxFhRB/BqFFvAPc5ZmwunTVe1rLIXxknoFi7GZdwBxkcu2Z25+HbHKeTyNC1taEQsNfcZhByHJCEK6T0+IsRBdptSy6971Bdc8qFCtylqY+p0SZ8OrGyaEV2hMcRl4lIQ4m35Zu8WanPmYr9LjmwkVAVmLpaEWW68jMcKx06NcczKyGtYRS4lDyfCtxwuFUQ6JIyjbkCkdNHcEBNL3asYepEz7HtsEttIoejIhbyGOS8jd/moE+E4depMk6iM/UiOIEUx2ufKqQS3K0TPIQ44WRruW5RY4X51bd+koaXSLEH0zljkfdvqwDFNXtaOGYV+fNbtGBrgs28f/o8a8Q68k1yVMN9+l+Hmm26Hi4C+/T13F4+TfQJp/r7lvm+572LLXVbPqzbaWW81x+Xpodjwi5eekIeUsUM1YeSaNF1ZgtJBDxbNxBAVB/I0gmEuzsKFApsxElx9QlV0GOEUxNSMhFDmrEOJUi7hGmCWnbz1BrwVVLbWnF4AAY3VHg+y5bXyxbBgY2ahuXxOBa1pBqsKW7twOmG1DLiitJpRbVFaYbJTmnnk3oRqQFhf+2vr9Uw0ZAxmJNB+zxhMw3LmIZIRDkgeI233oiE147cV3KYveatL29RsTyFtlSCVxTWWiJtG7zRRmjKYRUnX7Vw5ssSeoWPQqllvesjHacsbwiEKhnEK/KRuQJiFScvzVW7KK4t53mB3WtaqSw22RKRCql0so4zKbOVELJnpX282tB/OxgBHN1pNi7WN2n+ohXmUQ0uGQ+KrJSuzab7Hx4qIwyg4RgM2FgcY9NapCvYEVMI7w+SangioULMDM7vy8yqY/30mrw7M0gjnPUmX6NTCDG7GhQ5mVlKvmM3p/oammJI/I1PKafyOmaIzF46ta4Ee+nAMEBjpHG15XKiIQxdKI+r3BBwcjCzQC0FZaJUQ0782a13J0axvZTxMQcE5RB3QEAkKnU5FgpB9ldv5Cma1vCvmlZEzyvtMoa5Ms+eAHBHW19W7ru33UDTtJrkjDG4+aPY8d8Yg1IX6tp58srR53ePBTFBGv6qwUtMvvQo2T6fCa75qs461IK7eXPlVm8LlA+kvaNxU+Gx2vu3zA4g+YtMTJYJEPJcdPJAuxWw0AJ2zxUyaZpVJ+LeOUbMQFHLnnF0ujjN0dnFcmnP2y8W9ubPzkeXrch45XF1ZLNFK6SJjZgv/OvHBHZC9CxelMVPS2EfuwlWzM/2/APhkEg3p9j8AAAD//wMAUEsDBBQABgAIAAAAIQD7u/x/EgUAANEPAAARAAAAd29yZC9zZXR0aW5ncy54bWy0V21v2zYQ/j5g/8Hw5znWu2yhTqEXa03RtMOcYp9pibaJSKJAUnHcYf99R0q0nYQp4m79YlP33D13PJ6Op3fvH+tq9IAZJ7RZjO0razzCTUFL0mwX4693+WQ2HnGBmhJVtMGL8QHz8fvrX395t484FgLU+AgoGh7VxWK8E6KNplNe7HCN+BVtcQPghrIaCXhk22mN2H3XTgpat0iQNamIOEwdywrGAw1djDvWRAPFpCYFo5xuhDSJ6GZDCjz8aQv2Fr+9SUaLrsaNUB6nDFcQA234jrRcs9U/ygbgTpM8fG8TD3Wl9fa29Ybt7ikrjxZvCU8atIwWmHM4oLrSAZLm5Nh7QXT0fQW+hy0qKjC3LbU6j9y/jMB5QRAU+PEyjtnAMQXLcx5SXsYTHHnIKbF28GPBnBGU3UUUjqvjkH/S/IyLl6LcXUanz2gqbZFAO8SPFdkzbqrLGL0zxr7AKlrcn3Piy5LmHwkP9ekM+cuwDFXdQ5/ImiHW94yhpOsiutk2lKF1BeFAaY+gOkcqOvkLhyz/1BI/KrnM7bDYVHIBqb+GlvaN0nq0j1rMCnivoR9a1ngqAXib6GYlkADGiLe4qlSDLCqMIIB9tGWohtamJcqmxBvUVeIOrVeCtqD0gGCfoTNQFjvEUCEwW7WoALaUNoLRSuuV9DMVKbRJBm/xYKGa5mm16hswWDSohp0/aaq3tMQyso6Rtx+RNFDebf/c5XNHFC4MRkp8JzO+EocK5xD8inzDcVN+7LggwKha63+I4HsB4EZ6/gI1cndocY6R6CBNP8mZOom8Iu0tYYyym6aE2vhpzshmgxk4IFBrt1A+hNG9yvMHjEq4p3+S347jv0AZXlH3DsryPqFC0PrDod1Brv+Hk5yely9MGyXXiz8pFVrVslLPni3nfaQSPSHW3HGs1IikTuYFRiTzcnvY91PEtrwsH4r8GRK4iZsZkZnnZzMT4oS2ayVGBCJYhibEtew8XRoRxwkzYwRuHLix0Y9nObbrmhHfToxRe7PQs4y59q0g9I0R+KnnJkYkmHneMjYhoeUvQ+MpzOZuEBrPdO5ar7DNY/uVnc7jMLCMGY3jMHYdI5KE8czIlsjyMUaQeLY/G7r4M8S3UnOukzCY+8Zcv17xmefZiXE/2dwLl8a8ZYmfp8bzWULFubkRgbIOjX7y2Mlz5WfaQ/DW1pGcdP9geiVb/6juLVJUrxlBo1s5C0+lxprdJ6TR+BrDhY7PkVW31uBk0gO8RlWVQxPSgEp1HZWEtxneqHV1i9j2xDtoMKMU7uGPRy55r2P2O6Nd26N7htq+pWsV2/MGS9KIT6TWct6tV9qqgRHkDOqa8ssDU3k6pWcfCWiR6mr8hFSrVbq4mXxdyeaIERcxJ2gx/rabpJ/7/BcVW8nOim9R2/YNer21F+OKbHfClmYCnkr4ilIP660zYI7CnB5TD6iQmwXtYXGSOVp2pudqmXuSeVrmnWS+lvknWaBlgZTt4EpmMB/dw12hl1K+oVVF97j8cMJfiPok8B1qcdaPT1BxtBcM8xQfPUT4EYYzXBIBH6ctKWv0KGc1R90Bg3aFDrQTT3QlJpXbpwxyVNa31BNjVfXPYpFjXUGgQleHen2a1q76wCvC4WZtYbATlGnsN4XZXlTS4gZeLlgpue/60DWHtmT7R9jv4b+TJMjmzjKdWLNZOPHiNJ3ES9uZOGGyjD0rSEJ/+c/wbupv8et/AQAA//8DAFBLAwQUAAYACAAAACEAt/GuJK8AAAAOAQAAEwAoAGN1c3RvbVhtbC9pdGVtMS54bWwgoiQAKKAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArI/BCsIwEER/JezdpnoQKW2lIJ5EhCp48JKm2zaQ7JYkiv69QcQv8Dhv4A1Tbp/Oigf6YJgqWGY5CCTNvaGxgst5v9iACFFRrywTVkAM27rsipbvXmMQLVrUEfs2vmyqb82pya7tAcQHHJVLMDEQaYdC0VUwxTgXUgY9oVMh4xkpdQN7p2KKfpQ8DEbjjvXdIUW5yvO17ExnDY9ezdPrK/uLqi7l70z9BgAA//8DAFBLAwQUAAYACAAAACEAL+E+iN8AAABVAQAAGAAoAGN1c3RvbVhtbC9pdGVtUHJvcHMxLnhtbCCiJAAooCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACckMFqwzAMQO+D/YPRPXVWmnYrcUo7J9Dr2KBX11ESQ2wF2xkbY/8+h5264y4ST0J6QuXhw47sHX0w5AQ8rHJg6DS1xvUC3l6b7BFYiMq1aiSHAhzBobq/K9uwb1VUIZLHc0TLUsGkfJYCvopit3la18/Zpjim0EiZnepTk8mtbI6yqHeJvoEltUtrgoAhxmnPedADWhVWNKFLzY68VTGh7zl1ndEoSc8WXeTrPN9yPSe9vdgRquWe3+kX7MItLqfN3vzXcjXX0VDv1TR8Aq9K/ke18M0rqh8AAAD//wMAUEsDBBQABgAIAAAAIQD2ObcZYwUAABpFAAASAAAAd29yZC9udW1iZXJpbmcueG1s7JvbbuM2EIbvC/QdDAG9TESdqAPWWThxXGyxLYo2fQBGom0hoiRQtJ28/ZLUwbZkeyV5k2IB3kQ2D59myJnhDzn69PmVJJMtpkWcpVPNuAXaBKdhFsXpaqr997S48bRJwVAaoSRL8VR7w4X2+e7XXz7tgnRDnjHlAyeckRbBLg+n2pqxPND1IlxjgopbEoc0K7Iluw0zomfLZRxifZfRSDeBAeSnnGYhLgrOeUDpFhVahQtf+9EiinZ8sgDaerhGlOHXPcMYDHF0X/e6IHMEiHtoGl2UNRgFdWFVB2SPAnGrOiRnHOmEc3AcyeyS3HEkq0vyxpE64US6AZ7lOOWdy4wSxPhXutIJoi+b/IaDc8Ti5ziJ2RtnAlhjUJy+jLCIz2oIxIoGE1ydZBFOrKimZFNtQ9Ogmn/TzBemB+X86tLMwEm/2/Lb+Tp+ZUnB6rm0z9qV0+dZuCE4ZXLVdIoTvo5ZWqzjvKkOZCyNd65ryPbSAmxJUo/b5UbPVDtX2ublNuyBfcyv9o4kpeWXiQbosZsC0czoY8LxPWtLCI/g/Y1HLc3B4ho9i08NMDsAGOKeh0XN8CqGHu6zW3DinmlVc8pdEZx4v7BGzxrYNuYAEG0GIUyrtkNcxPQDVhGxaD0MV++RLuYihtaoaJKmJC57FoKaaB8QywBLsrCpZ4KJhy2a0wDfyMEe5qvrEvV3mm3yPS2+jvZlX7J3Qj0NYFUJf1iEiuuM+XeNcl7JSRh8WaUZRc8Jt4in74Rn4ETugPjLA1lc5Ef8KttF/FQflon4EG0moiRqd1wFoueCURSyvzZkcvTtC08lriY5PKCYS0gqGkvBOFsyTO8pRi9iiKCkhbhtsEU8rABYQMDTXNNFD9kkLP6Ktzh5estxPWb99kzj6E/Rl4i+ciwjeVKPmJm+7UP4WPYkW9ER80tpVMDyhB/mwAY+4PeTNkgb6+lGOY9r3AVpGiMcxgRVN+OsJ37C1X2/GbdN+x9h3ZrgJSub87+puMSp8FM0TzXXlKasUbqSctuCQIzVq8G6ZLWtN9rWG75s4QccPyW3WIzo502S7TD9ihnfi9MemYM9Mmx7hEtmx6X7a1z6JyMoPe2RdcojGq/W510yDXjskuH1cMk6EWPjXLoYc/bgHTI9b8QO2R8XdM5gl7gHI1xyPizo4PCgs61WaegVdPBjgs4dvEMOGFMW3I8LOm+4S26rLPRyyfuwoPOHBx20W6XhTNDpR8e8oFzUAOLAGq4BfMu2vblXGqs0wLH1SgNckRlKAygNoDSA0gBtl5QGeD8NIKr7YA1gmN7CmDnz0tixGuDB8x5dZ243S9FsxM+iAXYBrS6LLGWFGBmnTFixRNzxaqgco+SCkgtKLnzfJSUXlFy4MuiUXHg/uSBK4WC5YDlw7tgPs9LYsXJhYXsP9v2sohxuhHpk0DMzlAZQGkBpAKUBlAZQGmC8BhC1Y7AGcJwHF/rulRrAX0ATLBawWYpmI9QjAyUXlFz4/g4puaDkgpILbZeUXHg/uSASbbhcmIGZO7u/8hcGY+Z7Mxf+xI8M3kUu/KCk+T/lwY9JEiUHlBxQckDJgbZLSg68nxwQUTlYDriPtgMfHfULwskwUo8ErsgMpQGUBlAaQGmAtktKA1ylAVJ59qcHLxqI9xeDaCPfbpSNjglc4EC/9O9IJtTWyQf9uuR0oPI/F9tQ07CAB6BvnmfWDpxiyn9v6BgKTI6EJrDOQ+0LUPl7SQcKHcdxget656HyPcszUPlUpQ11AXAM1zQ773/umdYFppRm3W2yXGB5oqCehcpwPAMVKduBep7vmtDpvqi6ZzqHzPJaKsW7bwAAAP//AwBQSwMEFAAGAAgAAAAhAIsTHYqQDAAASXgAAA8AAAB3b3JkL3N0eWxlcy54bWy8nVlz2zgSx9+3ar8DS0+7D4l8yHaSGmfKduK1a+PEEzmTZ4iELGxIQktSPubTLwAeAt0ExQZ7/WJLpPqHo/vfAHj+9vtTEgcPPMuFTE8n+2/3JgFPQxmJ9P508uPu8s27SZAXLI1YLFN+Onnm+eT3j3//22+PH/LiOeZ5oABp/iEJTyerolh/mE7zcMUTlr+Va56qnUuZJaxQX7P7acKyX5v1m1Ama1aIhYhF8Tw92Ns7nlSYbAhFLpci5J9kuEl4Whj7acZjRZRpvhLrvKY9DqE9yixaZzLkea4ancQlL2EibTD7MwBKRJjJXC6Lt6oxVY0MSpnv75lPSbwFHOEABwBwHPInHONdxZgqS5sjIhznuOGIyOL4VcYCRBsU4uCwrof+p80tVh4V0QqHq3001basYCuWr9rEZYwjzixiGWCxDH/ZTI7rtKMG+JxoHybhh+v7VGZsESuSispABVZgwPqv8o/+Zz7yJ7Ndd0v1YRnrD6rXPirpRjL8xJdsExe5/prdZtXX6pv5dynTIg8eP7A8FOJO1VcVmghV/tVZmouJ2sNZXpzlgnXuXOkPnXvCvLA2n4tITKa6xPwvtfOBqW4/OKi3XOgatLbFLL2vt/H0zY+5XRNr00JxTycsezM/04bTqmHlf6u565ffTMFrFgpTDlsWXGUllRQ0NBY6CR6cHNdfvm+0L9imkFUhBlD+b7BT0OMqWanUNS8zqNrLl19UrPBoXqgdpxNTltr44/o2EzJTWfJ08v59tXHOE3Elooin1g/TlYj4zxVPf+Q82m7/49IEYrUhlJtUfT5U1TeVyKPPTyFf67yp9qZM++SrNoj1rzdiW7gx/28N26880WW/4kwPHsH+S4SpPgpxoC1yq7XdzM2LtptfoQo6fK2CZq9V0NFrFWSE8BoFnbxWQe9eqyCD+X8WJNJIjQPm97AYQN3FcagRzXGIDc1xaAnNcUgFzXEoAc1xBDqa44hjNMcRpghOIUNXFFrBfuiI9n7u7jHCj7t7SPDj7h4B/Li7E74fd3d+9+PuTud+3N3Z24+7O1njueVUK7hWMkuL0SpbSlmksuBBwZ/G01iqWGZFTcPTgx7PSBpJgCkzWzUQj6aFzHzfHSFGpP7jeaEXfoFcBktxv8l4PrriPH3gsVzzgEWR4hECM15sMkeP+MR0xpc842nIKQObDqpXgkG6SRYEsblm92QsnkbE3VcTSZJCE9Bq/bzSIhEEQZ2wMJPjqyYZWX74IvLxfaUhwfkmjjkR6ytNiBnW+LWBwYxfGhjM+JWBwYxfGFg+o+qiikbUUxWNqMMqGlG/lfFJ1W8VjajfKhpRv1W08f12J4rYpHh71rE//NjdRSz1OZDR9ZiL+5SpCcD44aY6ZhrcsozdZ2y9CvRR6W6s3WZsOecyeg7uKMa0hkQ1rzchcqFaLdLN+A5t0ajE1fCI5NXwiATW8MZL7EZNk/UE7YpmPTPfLIpO0RrSINHOWbwpJ7Tj1caK8RG2FcClyHIyGXRjCSL4q57OandSZL5tLcdXbMsaL6uXWYm0ehWSoJb6hClNGr56XvNMLct+jSZdyjiWjzyiI86LTJaxZkv+wLhkkOQ/J+sVy4VZK7UQw4f6+uqJ4IatRzfoNmYipfHb5zcJE3FAN4O4urv5EtzJtV5m6o6hAZ7LopAJGbM6EviPn3zxT5oKnqlFcPpM1NozosNDBnYhCAaZkiQjIpKaZopUkIyhhvdv/ryQLItoaLcZL68nKTgRcc6SdTnpINCWyouPKv8QzIYM70+WCX1ciEpUdyQw67Bhvln8h4fjU91XGZAcGfq2KczxRzPVNdZ0uPHThBZu/BTBeFMNDzp+CRrbwo1vbAtH1diLmOW5cJ5C9eZRNbfmUbd3/OKv4slYZstNTNeBNZCsB2sgWRfKeJOkOWWLDY+wwYZH3V7CkDE8gkNyhvevTERkzjAwKk8YGJUbDIzKBwZG6oDxV+hYsPGX6Viw8dfqlDCiKYAFo4oz0uGf6CyPBaOKMwOjijMDo4ozA6OKs8NPAV8u1SSYboixkFQxZyHpBpq04MlaZix7JkJ+jvk9IzhAWtJuM7nUd7LItLyImwCpj1HHhJPtEkfl5J98QVY1zaKsF8ERURbHUhIdW9sOOMbSOnB49H6nmbmTY3QVbmMW8pWMI5452uS2VevleXlbxsvqm2oMOuz5RdyvimC+ao7225jjvZ2W9YK9Zba7wK4+P67vZ+kyu+GR2CR1ReHNFMeHw41NRLeMZ7uNtzOJluXRQEtY5vFuy+0suWV5MtASlvluoKXRacuyTw+fWParMxBO+uKnWeM5gu+kL4oa485i+wKpsewKwZO+KGpJJTgLQ322AHpnmGbc9sPE47bHqMhNwcjJTRmsKzeiT2Df+YPQIzsmaZrymqsnXhZ3aCbRgzLnHxtZHrdvnXAaflPXtZo4pTkPOjmHw09ctbKMux8Hpxs3YnDecSMGJyA3YlAmcpqjUpKbMjg3uRGDk5Qbgc5WcETAZStoj8tW0N4nW0GKT7YaMQtwIwZPB9wItFAhAi3UETMFNwIlVGDuJVRIQQsVItBChQi0UOEEDCdUaI8TKrT3ESqk+AgVUtBChQi0UCECLVSIQAsVItBC9ZzbO829hAopaKFCBFqoEIEWqpkvjhAqtMcJFdr7CBVSfIQKKWihQgRaqBCBFipEoIUKEWihQgRKqMDcS6iQghYqRKCFChFooZa3GvoLFdrjhArtfYQKKT5ChRS0UCECLVSIQAsVItBChQi0UCECJVRg7iVUSEELFSLQQoUItFDNycIRQoX2OKFCex+hQoqPUCEFLVSIQAsVItBChQi0UCECLVSIQAkVmHsJFVLQQoUItFAhoi8+q1OUrsvs9/FHPZ1X7A8/dVVV6rt9K7eNOhyOqmvlZg2/F+Fcyl9B542Hh2a9MQwiFrGQ5hC147S6zTWXRKBOfH676L/Dx6aPfOhSdS+EOWcK4LOhluCYyqwv5G1LsMib9UW6bQlmnbO+7GtbgmFw1pd0jS7ri1LUcASM+9KMZbzvMO/L1pY57OK+HG0Zwh7uy8yWIezgvnxsGR4FOjm/tD4a2E/HzfWlgNAXjhbhxE3oC0voqzodQ2EMdZqbMNR7bsJQN7oJKH86MXjHulFoD7tRfq6GMsO62l+obgLW1ZDg5WqA8Xc1RHm7GqL8XA0TI9bVkIB1tX9ydhO8XA0w/q6GKG9XQ5Sfq+FQhnU1JGBdDQlYV48ckJ0Yf1dDlLerIcrP1XByh3U1JGBdDQlYV0OCl6sBxt/VEOXtaojyczVYJaNdDQlYV0MC1tWQ4OVqgPF3NUR5uxqi+lxtjqK0XI3ysGWOm4RZhrgB2TLEJWfL0GO1ZFl7rpYsgudqCfqq9jlutWQ7zU0Y6j03Yagb3QSUP50YvGPdKLSH3Sg/V+NWS12u9heqm4B1NW615HQ1brXU62rcaqnX1bjVktvVuNVSl6txq6UuV/snZzfBy9W41VKvq3GrpV5X41ZLblfjVktdrsatlrpcjVstdbl65IDsxPi7Grda6nU1brXkdjVutdTlatxqqcvVuNVSl6txqyWnq3GrpV5X41ZLva7GrZbcrsatlrpcjVstdbkat1rqcjVuteR0NW611Otq3Gqp19W41dKNMhEEj4CaJywrArrnxV2xfFWw8Q8n/JFmPJfxA48C2qZ+QbVy+th6/ZVmm1cJqt8Xqs/0E9Ct25Wi8gmwFdD88DpqXlOljXVNguqFYNVmU+HqdK35nOVqTV39Zm/vYrb/7nMV5q4Xftmv+5o1X7pf9+V4Z9rp5E4kPA++8sfgu0yY6e7tm8o6dpp3pnXuCXO42dTfemladbq29dI0s81695npQNjl4Ur1eVg9w8vR5dWzeJubycyTeF86wPHAXlOxrRDrX1ehtY2b8netqCnr76h3oYXfU2eTGHpjpcwdrgq+r6JkVw1VfRZxGQPqw3Wqg+2xCqKyptETK1Fq/wWP4xtW/lqu3T+N+bIo9+7vmUc3vNi/KJ9C6LTPzHDlBEzblSm/9sdJ+V6C6joKpzR1Tu7obnNRz9iedtetlTaa2ugyt/c/vqyUGT22u8teZaqkbzrHgZQCq31YiQ6VbISJD+1dfS1TNVCG+tEST8WGxdVd7laCGSCAdsjrY4igseUoaXZ1NdTWiqO19XMC2i3c35t9uqyu+KBJp7aYzmUW8cwME6VYTKn6OeVVw/9ScxbzQZXJmzcdqonAltxIycu2kZmXdS1CL2OhxoOIX40z/9PPvMwHTfd3pYf6U/7xfwAAAP//AwBQSwMEFAAGAAgAAAAhANyn8URlAQAAIAQAABQAAAB3b3JkL3dlYlNldHRpbmdzLnhtbJzTUW/CIBAA4Pcl+w8N70p1akxja7IsJnve9gMQrpYIXAO46n79oFZX44vdSzna3pcDjtX6qFXyDdZJNDmZjFOSgOEopNnl5OtzM1qSxHlmBFNoICcncGRdPD+tmqyB7Qd4H/50SVCMyzTPSeV9nVHqeAWauTHWYMLHEq1mPkztjmpm94d6xFHXzMutVNKf6DRNF6Rj7CMKlqXk8Ib8oMH4Np9aUEFE4ypZu4vWPKI1aEVtkYNzYT1anT3NpLkyk9kdpCW36LD047CYrqKWCumTtI20+gPmw4DpHbDgcBxmLDuDhsy+I8UwZ3F1pOg5/yumB4jDIGL6cqkjDjG9ZznhRTWMu5wRjbnMs4q56lYs1TBx1hPPDaaQ7/smDNu0+RU86XiGmmfvO4OWbVWQQlcmobGSFo7PcD5xaEM4tu/jtnRBqWIQdq0I9xdrL7X8gQ3aV4uNA0uLFb2518UvAAAA//8DAFBLAwQUAAYACAAAACEApdoeknICAABGCAAAEgAAAHdvcmQvZm9udFRhYmxlLnhtbLyUT3KbMBTG953pHRj2MQJj4niCM9M0nukmiyY5gCyE0UR/GEnY8Rm67D16g96mvUefBNh0nDQhi5qxeTzp/dD79MmXV0+CB1uqDVMyD+MJCgMqiSqY3OThw/3qbB4GxmJZYK4kzcM9NeHV8uOHy92iVNKaAOqlWQiSh5W19SKKDKmowGaiaiphsFRaYAuPehMJrB+b+owoUWPL1owzu48ShLKww+i3UFRZMkI/K9IIKq2vjzTlQFTSVKw2PW33FtpO6aLWilBjoGfBW57ATB4wcXoCEoxoZVRpJ9BMtyKPgvIY+UjwI2A2DpCcADJCn8Yx5h0jgsohhxXjONmBw4oB532LGQCKZhQimfbrcDdXPmCZwhbVOFy/R5GrxRZX2FR/E0s+jpgOiK3BuCKPQyYdJ9rsANwLt4eCLL5spNJ4zYEErgzAWIEHu1/YH3fzIX3yeSdLF5TcBaDasju5wW4hsQDQPRPUBLd0F3xVAks/ocZSGRrDnC0GGZATLENTNEMpfBOI0jByE0mFtaEO1k5EbbrEgvF9n9We6wdqZknV57dYM9dMO2TYBgYas0Z5eIMQSm5Wq7DNxHl4DZnz+exTl0ncu/znostMDxnkMsRz/GPccojnHObAO6NWiRNFrjFna81eUGLlFXBXCjoko5QwO2bMOCXSEyXgDypJz/+LEndM3DWtJTC3t5DrV/z7x7dfP793rZxoFINbEKgT99ezGs2z5zTCjVWjJPJdgCePEiXz+apvfyhRnL0iUeomjTWLAK/gF8zijkt7bNzxGWeW9x0blA3NknqzHDJOieTY97/NcvGaWbrALP8AAAD//wMAUEsDBBQABgAIAAAAIQBtMC69gAEAAOoCAAARAAgBZG9jUHJvcHMvY29yZS54bWwgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8kstOwzAQRfdI/EPkfWo7FYVGaSoegg1ISBSB2Bl7WgyJY9lTQv4eJ2lTghC7edw5Gt9xtvwqi+gTnNeVWRA+YSQCIyulzWZBHlfX8RmJPAqjRFEZWJAGPFnmx0eZtKmsHNy7yoJDDT4KJONTaRfkDdGmlHr5BqXwk6AwobmuXCkwpG5DrZAfYgM0YWxGS0ChBAraAmM7EMkOqeSAtFtXdAAlKRRQgkFP+YTTgxbBlf7Pga7zQ1lqbCz8Kd03B/WX14OwrutJPe2kYX9On+9uH7qnxtq0XkkgeaZkihoLyDN6CEPkt6/vILEvD0mIpQOBlcuv4NWJrruvtF5/QFNXTvkwN8qCTIGXTlsMF+ypo0JQF8LjXTjpWoO6aPLzcAZhopttIbDpcL8E7YyDT93+iZzPOsmQZzuH++1ARcGZtPdx33maXl6trkmeMD6P2Tzmpyt2mibTlLGXdsHR/AFY7jb4l5jMYpbEnK0YT6cnY+Ie0Hs0/p35NwAAAP//AwBQSwMEFAAGAAgAAAAhAGrLGZHjAQAA5AMAABAACAFkb2NQcm9wcy9hcHAueG1sIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnFPLbtswELwX6D8IuseU7NQNDJpB4aDIoW0MWEnOLLWyiVIkQW6MuF/fpRSrdNtTddoZroazD/Lb194URwhRO7su61lVFmCVa7Xdr8vH5vPVTVlElLaVxllYlyeI5a14/45vg/MQUEMsSMLGdXlA9CvGojpAL+OMji2ddC70EgmGPXNdpxXcOfXSg0U2r6olg1cE20J75SfBclRcHfF/RVunkr/41Jw86QneQO+NRBDf0p9m1jrsOZtY3jiUptE9iMWC+AnxrdxDFHPOxoA/u9ASXi45G0O+OcggFVILRf1hXnOWEfyT90YridRd8VWr4KLrsHgYLBdJgLM8hVMZO1AvQeNJVJzlkH/RlhzU5GWMyFuQ+yD9IYpFMjghvlPSwIY6IDppInD2m+D3INN0t1Ing0dcHUGhC0XUP2m+87L4LiOkvq3LowxaWizHtBEMsfERg2g0GtKe8BDmaXmsr0U9JFBwmTiAwQPFl+6GG+JDR7XhP8zWudnBw2g1s5M7O9/xh+rG9V7aE62GpWrOKLX7R3z0jbtLG/LWx0sym/2zxsPOS5Um9PHmOt+C7IjviIWWxjoNZiL4PZURTLqA/rV7aM85fx+kvXoaH62ol7OKvmGRzhxtw/SaxC8AAAD//wMAUEsDBBQABgAIAAAAIQB0Pzl6wgAAACgBAAAeAAgBY3VzdG9tWG1sL19yZWxzL2l0ZW0xLnhtbC5yZWxzIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAjM+xisMwDAbg/eDewWhvnNxQyhGnSyl0O0oOuhpHSUxjy1hqad++5qYrdOgoif/7Ubu9hUVdMbOnaKCpalAYHQ0+TgZ++/1qA4rFxsEuFNHAHRm23edHe8TFSgnx7BOrokQ2MIukb63ZzRgsV5QwlstIOVgpY550su5sJ9Rfdb3W+b8B3ZOpDoOBfBgaUP094Ts2jaN3uCN3CRjlRYV2FxYKp7D8ZCqNqrd5QjHgBcPfqqmKCbpr9dN/3QMAAP//AwBQSwECLQAUAAYACAAAACEA5CSJTH0BAAApBgAAEwAAAAAAAAAAAAAAAAAAAAAAW0NvbnRlbnRfVHlwZXNdLnhtbFBLAQItABQABgAIAAAAIQAekRq37wAAAE4CAAALAAAAAAAAAAAAAAAAALYDAABfcmVscy8ucmVsc1BLAQItABQABgAIAAAAIQBQy797UAsAAKo9AAARAAAAAAAAAAAAAAAAANYGAAB3b3JkL2RvY3VtZW50LnhtbFBLAQItABQABgAIAAAAIQDX5gieGwEAAEQEAAAcAAAAAAAAAAAAAAAAAFUSAAB3b3JkL19yZWxzL2RvY3VtZW50LnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhAJa1reLxBQAAUBsAABUAAAAAAAAAAAAAAAAAshQAAHdvcmQvdGhlbWUvdGhlbWUxLnhtbFBLAQItABQABgAIAAAAIQD7u/x/EgUAANEPAAARAAAAAAAAAAAAAAAAANYaAAB3b3JkL3NldHRpbmdzLnhtbFBLAQItABQABgAIAAAAIQC38a4krwAAAA4BAAATAAAAAAAAAAAAAAAAABcgAABjdXN0b21YbWwvaXRlbTEueG1sUEsBAi0AFAAGAAgAAAAhAC/hPojfAAAAVQEAABgAAAAAAAAAAAAAAAAAHyEAAGN1c3RvbVhtbC9pdGVtUHJvcHMxLnhtbFBLAQItABQABgAIAAAAIQD2ObcZYwUAABpFAAASAAAAAAAAAAAAAAAAAFwiAAB3b3JkL251bWJlcmluZy54bWxQSwECLQAUAAYACAAAACEAixMdipAMAABJeAAADwAAAAAAAAAAAAAAAADvJwAAd29yZC9zdHlsZXMueG1sUEsBAi0AFAAGAAgAAAAhANyn8URlAQAAIAQAABQAAAAAAAAAAAAAAAAArDQAAHdvcmQvd2ViU2V0dGluZ3MueG1sUEsBAi0AFAAGAAgAAAAhAKXaHpJyAgAARggAABIAAAAAAAAAAAAAAAAAQzYAAHdvcmQvZm9udFRhYmxlLnhtbFBLAQItABQABgAIAAAAIQBtMC69gAEAAOoCAAARAAAAAAAAAAAAAAAAAOU4AABkb2NQcm9wcy9jb3JlLnhtbFBLAQItABQABgAIAAAAIQBqyxmR4wEAAOQDAAAQAAAAAAAAAAAAAAAAAJw7AABkb2NQcm9wcy9hcHAueG1sUEsBAi0AFAAGAAgAAAAhAHQ/OXrCAAAAKAEAAB4AAAAAAAAAAAAAAAAAtT4AAGN1c3RvbVhtbC9fcmVscy9pdGVtMS54bWwucmVsc1BLBQYAAAAADwAPANQDAAC7QAAAAAA='''
-
-
-# I/O
-def load_json_files(glob_pattern: str):
-    files = sorted(glob(glob_pattern))
-    data = []
-    for f in files:
-        try:
-            with open(f, "r", encoding="utf-8") as fh:
-                js = json.load(fh)
-            data.append((f, js))
-        except Exception as e:
-            print(f"Failed to read {f}: {e}")
-    return data
-
-
-def ensure_template_docx(path: str) -> None:
-    """
-    Writes the embedded template DOCX to disk if it doesn't exist.
-    """
-    if os.path.exists(path) and os.path.getsize(path) > 0:
-        return
-
-    b64_clean = "".join((TEMPLATE_DOCX_B64 or "").split())
-    if not b64_clean:
-        raise RuntimeError(
-            "TEMPLATE_DOCX_B64 is empty. Paste your template DOCX Base64 string into TEMPLATE_DOCX_B64."
-        )
-
-    try:
-        raw = base64.b64decode(b64_clean)
-    except Exception as e:
-        raise RuntimeError(f"Failed to decode TEMPLATE_DOCX_B64: {e}")
-
-    with open(path, "wb") as f:
-        f.write(raw)
-
-
-#JSON NORMALIZATION
-def strip_html(s: str) -> str:
-    if not s:
-        return ""
-    s = html.unescape(s)
-    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.I)
-    s = re.sub(r"<[^>]+>", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
-def get_outcome_title(js: Dict[str, Any]) -> str:
-    if js.get("outcome_title"):
-        return str(js["outcome_title"]).strip()
-    oi = js.get("outcome_identification") or {}
-    return str(oi.get("title") or "N/A").strip()
-
-
-def get_outcome_long_desc(js: Dict[str, Any]) -> str:
-    if js.get("outcome_long_description"):
-        return strip_html(str(js["outcome_long_description"]))
-    oi = js.get("outcome_identification") or {}
-    return strip_html(str(oi.get("long_description") or oi.get("description") or ""))
-
-
-def get_course_name(js: Dict[str, Any]) -> str:
-    ci = js.get("course_info") or js.get("course_identification") or {}
-    return str(ci.get("name") or "N/A").strip()
-
-
-def get_course_code(js: Dict[str, Any]) -> str:
-    ci = js.get("course_info") or js.get("course_identification") or {}
-    return str(ci.get("course_code") or "N/A").strip()
-
-
-def get_enrollment_count(js: Dict[str, Any]) -> int:
-    ci = js.get("course_info") or js.get("course_identification") or {}
-    enrollments = ci.get("enrollments", [])
-    if isinstance(enrollments, list):
-        for enrollment in enrollments:
-            if isinstance(enrollment, dict) and enrollment.get("type") == "student":
-                amount = enrollment.get("amount")
-                if amount is not None:
-                    try:
-                        return int(amount)
-                    except (ValueError, TypeError):
-                        pass
-    return 0
-
-
-def normalize_course_line_for_template(course_code: str) -> str:
-    """
-    Template wants: 'CSE # 301'
-    If we see 'CSE 301' or 'CSE301' or 'CSE #301', normalize.
-    """
-    s = (course_code or "").strip()
-    m = re.search(r"\b([A-Z]{2,4})\s*#?\s*(\d{3})\b", s)
-    if m:
-        return f"{m.group(1)} # {m.group(2)}"
-    return s if s else "N/A"
-
-
-def get_overall_summary(js: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Returns normalized overall summary dict with keys:
-      sample_size, number_competent, percent_competent, outcome_met
-    """
-    if isinstance(js.get("assessment_summary"), dict):
-        a = js["assessment_summary"]
-        return {
-            "sample_size": a.get("total_students_assessed"),
-            "number_competent": a.get("number_competent"),
-            "percent_competent": a.get("percent_competent"),
-            "outcome_met": a.get("outcome_met"),
-        }
-
-    r = js.get("results") or {}
-    o = r.get("overall_summary")
-    if isinstance(o, dict):
-        return {
-            "sample_size": o.get("sample_size"),
-            "number_competent": o.get("number_competent"),
-            "percent_competent": o.get("percent_competent"),
-            "outcome_met": o.get("outcome_met"),
-        }
-
-    return {}
-
-
-def get_threshold(js: Dict[str, Any]) -> str:
-    assigns = js.get("contributing_assignments") or []
-    first = assigns[0] if isinstance(assigns, list) and assigns and isinstance(assigns[0], dict) else {}
-    thr = first.get("threshold")
-    if thr is None or thr == "":
-        return "70%"
-    return str(thr).strip()
-
-
-def infer_metric_instrument_type(js: Dict[str, Any]) -> str:
-    assigns = js.get("contributing_assignments") or []
-    first = assigns[0] if isinstance(assigns, list) and assigns and isinstance(assigns[0], dict) else {}
-    explicit = first.get("metric_instrument_type") or first.get("metric")
-    if explicit:
-        return str(explicit).strip()
-
-    name = str(first.get("name") or "").lower()
-    desc = str(first.get("description") or "").lower()
-
-    if "essay" in name or "essay" in desc:
-        return "Essay"
-    if "exam" in name or "exam" in desc:
-        return "Exam"
-    if "quiz" in name or "quiz" in desc:
-        return "Quiz"
-    if "project" in name:
-        return "Project"
-    return "Assignment"
-
-
-def build_structured_summary(js: Dict[str, Any]) -> str:
-    """
-    Only used to give the LLM context when outcome was not met.
-    """
-    overall = get_overall_summary(js)
-
-    assigns = js.get("contributing_assignments") or []
-    rubric_count = 0
-    if isinstance(assigns, list):
-        for a in assigns:
-            if isinstance(a, dict) and isinstance(a.get("rubric"), list):
-                rubric_count += len(a["rubric"])
-
-    lines = [
-        f"Course name: {get_course_name(js)}",
-        f"Course code: {get_course_code(js)}",
-        f"Outcome title: {get_outcome_title(js)}",
-        f"Threshold: {get_threshold(js)}",
-        f"Sample size: {overall.get('sample_size', 'N/A')}",
-        f"Number competent: {overall.get('number_competent', 'N/A')}",
-        f"Percent competent: {overall.get('percent_competent', 'N/A')}",
-        f"Outcome met: {overall.get('outcome_met', 'N/A')}",
-        f"Rubric criteria total: {rubric_count}",
-    ]
-    return "\n".join(lines)
-
-
-def get_description_file_contents(js: Dict[str, Any]):
-    """
-    Collect non-empty text values from contributing_assignments[*].description_files_content.
-    """
-    contents = []
-    assigns = js.get("contributing_assignments") or []
-    if not isinstance(assigns, list):
-        return contents
-
-    for a in assigns:
-        if not isinstance(a, dict):
-            continue
-        files_content = a.get("description_files_content")
-        if not isinstance(files_content, dict):
-            continue
-
-        for value in files_content.values():
-            text = str(value or "").strip()
-            if text:
-                contents.append(text)
-
-    return contents
-
-
-def get_section2_sources(js: Dict[str, Any]) -> list[Dict[str, str]]:
-    """
-    Build one Section 2 source block per contributing assignment so each assignment
-    is represented in output.
-    """
-    sources: list[Dict[str, str]] = []
-    assigns = js.get("contributing_assignments") or []
-    if not isinstance(assigns, list):
-        return sources
-
-    for idx, a in enumerate(assigns, start=1):
-        if not isinstance(a, dict):
-            continue
-
-        title = str(a.get("name") or f"Assignment {idx}").strip()
-        parts = []
-
-        desc = strip_html(str(a.get("description") or "")).strip()
-        if desc:
-            parts.append(desc)
-
-        files_content = a.get("description_files_content")
-        if isinstance(files_content, dict):
-            for value in files_content.values():
-                text = str(value or "").strip()
-                if text:
-                    parts.append(text)
-
-        if parts:
-            joined = "\n\n".join(parts).strip()
-            if joined:
-                sources.append({"title": title, "text": joined})
-
-    return sources
-
-
-def is_assessment_section_heading(text: str) -> bool:
-    return bool(re.match(r"^Assessment Report Section\s+\d+\s*:", (text or "").strip()))
-
-
-def insert_paragraph_after(paragraph: Paragraph, text: str, bold: bool = False) -> Paragraph:
-    new_p = OxmlElement("w:p")
-    paragraph._p.addnext(new_p)
-    new_para = Paragraph(new_p, paragraph._parent)
-    run = new_para.add_run(text)
-    if bold:
-        run.bold = True
-    return new_para
-
-
-
-def normalize_section2_source_text(text: str) -> str:
-    """
-    Normalize noisy extraction text before sending to AI:
-    - remove isolated page numbers
-    - collapse excessive whitespace
-    """
-    text = str(text or "")
-    lines = [ln.strip() for ln in text.splitlines()]
-    cleaned_lines = []
-    for ln in lines:
-        if not ln:
-            continue
-        if re.fullmatch(r"\d{1,3}", ln):
-            continue
-        cleaned_lines.append(ln)
-    out = "\n".join(cleaned_lines)
-    out = re.sub(r"[ \t]+", " ", out)
-    out = re.sub(r"\n{3,}", "\n\n", out)
-    return out.strip()
-
-
-def format_section2_with_openai(raw_contents: Iterable[str], js: Dict[str, Any]) -> list[Dict[str, Any]]:
-    """
-    Uses OpenAI to clean and normalize Section 2 content into polished paragraphs.
-    Returns structured blocks for Section 2 rendering.
-    """
-    contents = [normalize_section2_source_text(c) for c in raw_contents if str(c or "").strip()]
-    contents = [c for c in contents if c]
-    if not contents:
-        return []
-
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key:
-        api_key = api_key.strip().strip('"').strip("'")
-    if not api_key:
-        return []
-
-    course_name = get_course_name(js)
-    course_code = get_course_code(js)
-    outcome_title = get_outcome_title(js)
-    joined = "\n\n--- SOURCE BLOCK ---\n\n".join(contents)
-
-    user_text = (
-        f"Course: {course_name} ({course_code})\n"
-        f"Outcome: {outcome_title}\n\n"
-        "Format these source blocks for ABET Section 2.\n"
-        "Keep one output block per source block when possible.\n"
-        "Remove the '--- SOURCE BLOCK ---' dividers in the output.\n\n"
-        f"{joined}"
-    )
-
-    try:
-        client = OpenAI(api_key=api_key)
-        response = client.responses.create(
-            model=OPENAI_MODEL,
-            input=[
-                {"role": "system", "content": prompt_section2_base},
-                {"role": "user", "content": user_text},
-            ],
-        )
-        out = (response.output_text or "").strip()
-        payload = json.loads(out)
-        blocks = payload.get("blocks", [])
-        formatted = []
-        for b in blocks:
-            if not isinstance(b, dict):
-                continue
-            intro = str(b.get("intro") or "").strip()
-            parts = b.get("parts")
-            closing = str(b.get("closing") or "").strip()
-            if not isinstance(parts, list):
-                continue
-            normalized_parts = []
-            for p in parts:
-                if not isinstance(p, dict):
-                    continue
-                heading = str(p.get("heading") or "").strip()
-                body = str(p.get("body") or "").strip()
-                if not heading or not body:
-                    continue
-                normalized_parts.append({"heading": heading, "body": body})
-            if not intro and not normalized_parts and not closing:
-                continue
-            formatted.append(
-                {
-                    "intro": intro,
-                    "parts": normalized_parts,
-                    "closing": closing,
-                }
-            )
-        if formatted:
-            return formatted
-    except Exception as e:
-        print(f"OpenAI section 2 formatting failed: {e}")
-
-    return []
-
-
-def update_section2_in_doc(doc: Document, js: Dict[str, Any]) -> None:
-    """
-    Rebuild Section 2 with AI-polished content from description_files_content.
-    """
-    sources = get_section2_sources(js)
-    if not sources:
-        return
-
-    heading_text = "Assessment Report Section 2: Assessment Instrument"
-    heading_idx = None
-    for i, p in enumerate(doc.paragraphs):
-        if (p.text or "").strip().startswith(heading_text):
-            heading_idx = i
-            break
-
-    if heading_idx is None:
-        doc.add_paragraph("")
-        heading = doc.add_paragraph(heading_text)
-        if heading.runs:
-            heading.runs[0].bold = True
-    else:
-        heading = doc.paragraphs[heading_idx]
-        to_remove = []
-        for p in doc.paragraphs[heading_idx + 1:]:
-            if is_assessment_section_heading(p.text):
-                break
-            to_remove.append(p)
-        for p in to_remove:
-            p._element.getparent().remove(p._element)
-
-    anchor = heading
-    show_assignment_titles = len(sources) > 1
-    for src in sources:
-        # Process each assignment independently to preserve one block per assignment.
-        formatted_blocks = format_section2_with_openai([src["text"]], js)
-
-        if show_assignment_titles:
-            anchor = insert_paragraph_after(anchor, "")
-            anchor = insert_paragraph_after(anchor, src["title"])
-            anchor = insert_paragraph_after(anchor, "")
-
-        if formatted_blocks:
-            block = formatted_blocks[0]
-            intro = str(block.get("intro") or "").strip()
-            parts = block.get("parts") or []
-            closing = str(block.get("closing") or "").strip()
-
-            if intro:
-                anchor = insert_paragraph_after(anchor, intro)
-                anchor = insert_paragraph_after(anchor, "")
-
-            for p in parts:
-                heading_text = str(p.get("heading") or "").strip()
-                body_text = str(p.get("body") or "").strip()
-                if not heading_text or not body_text:
-                    continue
-                anchor = insert_paragraph_after(anchor, heading_text)
-                anchor = insert_paragraph_after(anchor, "")
-                anchor = insert_paragraph_after(anchor, body_text)
-                anchor = insert_paragraph_after(anchor, "")
-
-            if closing:
-                anchor = insert_paragraph_after(anchor, closing)
-                anchor = insert_paragraph_after(anchor, "")
-            continue
-
-        # Fallback layout if AI unavailable/failed.
-        fallback = normalize_section2_source_text(src["text"])
-        if fallback:
-            for ln in fallback.splitlines():
-                clean_ln = ln.strip()
-                if not clean_ln:
-                    continue
-                anchor = insert_paragraph_after(anchor, clean_ln)
-
-
-# OPENAI (FEEDBACK ONLY)
-def generate_feedback_with_openai(summary_text: str) -> str:
-    api_key = os.getenv("OPENAI_API_KEY")
-    # sanitize common .env formatting issues (surrounding quotes, stray spaces)
-    if api_key:
-        api_key = api_key.strip().strip('"').strip("'")
-
-    if not api_key:
-        print("OPENAI_API_KEY not set; skipping OpenAI feedback and returning 'NA'.")
-        return "NA"
-
-    try:
-        client = OpenAI(api_key=api_key)
-        response = client.responses.create(
-            model=OPENAI_MODEL,
-            input=[
-                {"role": "system", "content": prompt_base},
-                {"role": "user", "content": summary_text},
-            ],
-        )
-        return (response.output_text or "").strip() or "NA"
-    except Exception as e:
-        print(f"OpenAI call failed: {e}")
-        return "NA"
-
-
-# DOCX EDITING (PRESERVE TEMPLATE FORMATTING)
-def replace_paragraph_text_preserve_style(p, new_text: str) -> None:
-    """
-    Replaces paragraph text while preserving formatting of the first run (best effort).
-    """
-    if p.runs:
-        proto = p.runs[0]
-        font = proto.font
-        bold = font.bold
-        italic = font.italic
-        underline = font.underline
-        name = font.name
-        size = font.size
-    else:
-        bold = italic = underline = name = size = None
-
-    for r in p.runs:
-        r.text = ""
-
-    run = p.add_run(new_text)
-    if name is not None:
-        run.font.name = name
-    if size is not None:
-        run.font.size = size
-    if bold is not None:
-        run.font.bold = bold
-    if italic is not None:
-        run.font.italic = italic
-    if underline is not None:
-        run.font.underline = underline
-
-
-def iter_all_paragraphs(doc: Document):
-    """
-    Yield paragraphs in document body AND inside all table cells.
-    """
-    for p in doc.paragraphs:
-        yield p
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for p in cell.paragraphs:
-                    yield p
-
-
-def safe_int(x) -> Optional[int]:
-    try:
-        if x is None:
-            return None
-        if isinstance(x, bool):
-            return None
-        if isinstance(x, (int, float)):
-            return int(x)
-        s = str(x).strip()
-        if s == "":
-            return None
-        return int(float(s))
-    except Exception:
-        return None
-
-
-def update_score_distribution_table(doc: Document, thr: str, sample_size, number_competent) -> None:
-    """
-    Expected template labels (from your template):
-      - "100%-70%"  
-      - "Below 70%"
-    """
-    n_total = safe_int(sample_size)
-    n_comp = safe_int(number_competent)
-    if n_total is None or n_comp is None:
-        return
-    n_below = max(0, n_total - n_comp)
-
-    # normalize threshold like "70%" -> "70"
-    thr_num = re.sub(r"[^0-9.]", "", str(thr))
-    thr_label = f"Below {thr_num}%" if thr_num else "Below 70%"
-    comp_label = f"100%-{thr_num}%" if thr_num else "100%-70%"
-
-    label_variants = {
-        "competent": {comp_label, "100%-70%", "100% - 70%", "70%-100%", "70% - 100%"},
-        "below": {thr_label, "Below 70%", "Below70%", "Below 70 %"},
-    }
-
-    for table in doc.tables:
-        for row in table.rows:
-            # collect cell texts
-            cells = row.cells
-            texts = [(" ".join((p.text or "").strip() for p in c.paragraphs)).strip() for c in cells]
-
-            # find which row this is
-            row_type = None
-            for t in texts:
-                if t in label_variants["competent"]:
-                    row_type = "competent"
-                    break
-                if t in label_variants["below"]:
-                    row_type = "below"
-                    break
-            if not row_type:
-                continue
-
-            # Strategy: write into the first purely-numeric-looking cell OR the cell immediately right of the label.
-            # 1) find label cell index
-            label_idx = None
-            for i, t in enumerate(texts):
-                if row_type == "competent" and t in label_variants["competent"]:
-                    label_idx = i
-                    break
-                if row_type == "below" and t in label_variants["below"]:
-                    label_idx = i
-                    break
-
-            new_val = str(n_comp if row_type == "competent" else n_below)
-
-            # 2) try numeric cell
-            wrote = False
-            for i, t in enumerate(texts):
-                if re.fullmatch(r"\d+", t):
-                    # replace all paragraphs in that cell with a single preserved-style paragraph
-                    cell = cells[i]
-                    if cell.paragraphs:
-                        replace_paragraph_text_preserve_style(cell.paragraphs[0], new_val)
-                        for extra in cell.paragraphs[1:]:
-                            replace_paragraph_text_preserve_style(extra, "")
-                    else:
-                        cell.add_paragraph(new_val)
-                    wrote = True
-                    break
-
-            # 3) fallback: cell right of label
-            if not wrote and label_idx is not None and label_idx + 1 < len(cells):
-                cell = cells[label_idx + 1]
-                if cell.paragraphs:
-                    replace_paragraph_text_preserve_style(cell.paragraphs[0], new_val)
-                    for extra in cell.paragraphs[1:]:
-                        replace_paragraph_text_preserve_style(extra, "")
-                else:
-                    cell.add_paragraph(new_val)
-
-
-def update_section1_in_doc(doc: Document, js: Dict[str, Any], feedback_text: Optional[str]) -> None:
-    outcome_title = get_outcome_title(js)
-    outcome_long = get_outcome_long_desc(js)
-    if outcome_long:
-        outcome_line = f"Outcome assessed ({outcome_title}) {outcome_long}"
-    else:
-        outcome_line = f"Outcome assessed ({outcome_title})"
-
-    class_line = normalize_course_line_for_template(get_course_code(js))
-    metric_line = f"Metric Instrument Type: {infer_metric_instrument_type(js)}"
-    thr = get_threshold(js)
-
-    enrollment_count = get_enrollment_count(js)
-    enrollment_line = f"Class Enrollment: {enrollment_count} students"
-
-    overall = get_overall_summary(js)
-    sample_size = overall.get("sample_size", "N/A")
-    number_comp = overall.get("number_competent", "N/A")
-    pct_comp = overall.get("percent_competent", "N/A")
-    outcome_met = overall.get("outcome_met", None)
-
-    sample_line = f"Sample size: {sample_size} students"
-
-    if isinstance(number_comp, (int, float)) and (pct_comp is not None):
-        comp_summary = f"{int(number_comp)} students scored {thr} or above on rubric ({pct_comp}%)"
-    else:
-        comp_summary = f"N/A students scored {thr} or above on rubric (N/A%)"
-
-    if outcome_met is True:
-        outcome_status_line = "Outcome was met"
-        changes_tail = "NA"
-    elif outcome_met is False:
-        outcome_status_line = "Outcome was not met"
-        changes_tail = (feedback_text or "NA").strip() or "NA"
-    else:
-        outcome_status_line = "Outcome was N/A"
-        changes_tail = "NA"
-
-    changes_prefix = (
-        "If outcome was not met, what changes need to be made to ensure that students can meet this outcome in the future?"
-    )
-    changes_line_full = f"{changes_prefix} {changes_tail}"
-
-    # Replace by matching existing template lines across body + tables
-    for p in iter_all_paragraphs(doc):
-        t = (p.text or "").strip()
-
-        if t.startswith("Outcome assessed"):
-            replace_paragraph_text_preserve_style(p, outcome_line)
-            continue
-
-        if re.fullmatch(r"[A-Z]{2,4}\s*#\s*\d{3}", t):
-            replace_paragraph_text_preserve_style(p, class_line)
-            continue
-
-        if t.startswith("Metric Instrument Type:"):
-            replace_paragraph_text_preserve_style(p, metric_line)
-            continue
-
-        if t.startswith("Class Enrollment:"):
-            replace_paragraph_text_preserve_style(p, enrollment_line)
-            continue
-
-        if t.startswith("To show competency, a student must score at least"):
-            replace_paragraph_text_preserve_style(
-                p, f"To show competency, a student must score at least {thr} on the assessment."
-            )
-            continue
-
-        if t.startswith("To show the outcome has been met,"):
-            replace_paragraph_text_preserve_style(
-                p, f"To show the outcome has been met, {thr} of the students must show competency."
-            )
-            continue
-
-        if t.startswith("Sample size:"):
-            replace_paragraph_text_preserve_style(p, sample_line)
-            continue
-
-        if "students scored" in t and "or above on rubric" in t:
-            replace_paragraph_text_preserve_style(p, comp_summary)
-            continue
-
-        if t.startswith("Outcome was"):
-            replace_paragraph_text_preserve_style(p, outcome_status_line)
-            continue
-
-        if t.startswith(changes_prefix):
-            replace_paragraph_text_preserve_style(p, changes_line_full)
-            continue
-
-    update_score_distribution_table(doc, thr, sample_size, number_comp)
-    #update_section2_in_doc(doc, js)
-    
-
-
-# main
-def main():
-    ensure_template_docx(template_path)
-
-    data = load_json_files(json_input_glob)
-    summary_records = []
-
-    for path, js in data:
-        base = Path(path).stem
-        print(f"\nProcessing {base} ...")
-
-        overall = get_overall_summary(js)
-        outcome_met = overall.get("outcome_met", None)
-
-        feedback_text = None
-        if outcome_met is False:
-            summary_text = build_structured_summary(js)
-            feedback_text = generate_feedback_with_openai(summary_text)
-
-        doc = Document(template_path)
-        update_section1_in_doc(doc, js, feedback_text)
-        update_section2_in_doc(doc, js)
-
-        out_path = os.path.join(out_dir, f"{base}_ABET_Report.docx")
-        doc.save(out_path)
-        print(f"Word report saved → {out_path}")
-
-        ca = js.get("contributing_assignments", []) or []
-        summary_records.append(
-            {
-                "input_file": path,
-                "contributing_assignments": len(ca) if isinstance(ca, list) else 0,
-                "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-            }
-        )
-
-    if summary_records:
-        with open(output_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=summary_records[0].keys())
-            writer.writeheader()
-            writer.writerows(summary_records)
-        print(f"\nSummary CSV written: {output_csv}")
-
-
-if __name__ == "__main__":
-    main()
+"""
+abetReportGenerator-template_embed.py
+------------------------------------
+ABET Assessment Report Generator
+
+- Reads Canvas JSON data from input_jsons/*.json
+- Writes DOCX reports to generated_pdfs/<json_stem>_ABET_Report.docx
+- Uses embedded DOCX template (Base64) written once to generated_pdfs/_ABET_TEMPLATE.docx
+- Uses OpenAI ONLY to fill the final "changes needed..." tail when outcome was not met
+- Preserves template formatting by replacing text inside existing template paragraphs AND table cells
+
+IMPORTANT:
+- Put your template DOCX Base64 into TEMPLATE_DOCX_B64.
+"""
+
+import os
+import json
+import csv
+import time
+import re
+import html
+import asyncio
+import base64
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from glob import glob
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+from docx import Document  # python-docx
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.table import _Cell
+from docx.text.paragraph import Paragraph
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
+
+
+# CONFIG
+load_dotenv()
+
+json_input_glob = "input_jsons/*.json"
+out_dir = "generated_pdfs"
+os.makedirs(out_dir, exist_ok=True)
+
+output_csv = "ABETReportSummary.csv"
+template_path = os.path.join(out_dir, "_ABET_TEMPLATE.docx")
+
+OPENAI_MODEL = "gpt-5.2"
+
+prompt_base = (
+    "You are an education assessment expert writing ABET assessment report feedback. "
+    "Output ONLY the text that should follow the question: "
+    "'If outcome was not met, what changes need to be made to ensure that students can meet this outcome in the future?' "
+    "Do not add headings, labels, bullets, or extra lines. 1-3 sentences. Concise and actionable."
+)
+
+prompt_section2_base = (
+    "You are formatting ABET report section content for faculty. "
+    "Rewrite the provided assessment instrument content into clean, professional plain text with this layout: "
+    "intro paragraph, then Part headings and body paragraphs. "
+    "Preserve the original meaning and details; do not invent facts. "
+    "Remove artifacts like standalone page numbers and broken OCR spacing. "
+    "If source uses numbered questions, leave it as it is. "
+    "Output STRICT JSON only in this schema: "
+    '{"blocks":[{"intro":"<1 short paragraph>","parts":[{"heading":"<numbered questions>: <title>","body":"<paragraph>"}],"closing":"<optional closing paragraph>"}]}. '
+    "Each part body should be one concise paragraph."
+    "No markdown. No code fences."
+)
+
+# TEMPLATE BASE64: Template by prof encoded in base64
+TEMPLATE_DOCX_B64 = r'''UEsDBBQABgAIAAAAIQDkJIlMfQEAACkGAAATAAgCW0NvbnRlbnRfVHlwZXNdLnhtbCCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC0lMtqwzAQRfeF/oPRtsRKuiilxMmij2UbaArdKvI4EdULaZzH33fsJKYUJy5NsjHIM/feowHNcLw2OllCiMrZjA3SPkvASpcrO8/Yx/Sld8+SiMLmQjsLGdtAZOPR9dVwuvEQE1LbmLEFon/gPMoFGBFT58FSpXDBCKRjmHMv5JeYA7/t9++4dBbBYg8rDzYaPkEhSo3J85p+b0kC6MiSx21jlZUx4b1WUiDV+dLmv1J6u4SUlHVPXCgfb6iB8daEqnI4YKd7o9EElUMyEQFfhaEuvnIh57mTpSFletymhdMVhZLQ6Cs3H5yEGGnmRqdNxQhl9/xtHLKM6Myn0VwhmElwPg5OxmlMKz8IqKCZ4cFZ2NLMIBD9+YfRWHdCRNxoiOcn2Pp2xwMiCS4BsHPuRFjB7P1iFD/MO0EKyp2KmYbzYzTWnRBIqwi239NfRW1zLJI66wdIqy3849r73VWpe/5PL69JJOuT7wfVWswhb8nm9aIffQMAAP//AwBQSwMEFAAGAAgAAAAhAB6RGrfvAAAATgIAAAsACAJfcmVscy8ucmVscyCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsksFqwzAMQO+D/YPRvVHawRijTi9j0NsY2QcIW0lME9vYatf+/TzY2AJd6WFHy9LTk9B6c5xGdeCUXfAallUNir0J1vlew1v7vHgAlYW8pTF41nDiDJvm9mb9yiNJKcqDi1kVis8aBpH4iJjNwBPlKkT25acLaSIpz9RjJLOjnnFV1/eYfjOgmTHV1mpIW3sHqj1FvoYdus4ZfgpmP7GXMy2Qj8Lesl3EVOqTuDKNain1LBpsMC8lnJFirAoa8LzR6nqjv6fFiYUsCaEJiS/7fGZcElr+54rmGT827yFZtF/hbxucXUHzAQAA//8DAFBLAwQUAAYACAAAACEAUMu/e1ALAACqPQAAEQAAAHdvcmQvZG9jdW1lbnQueG1s7Fvrb9s4Ev9+wP0PRBYF9oA01lu2sc1C1qObw+5e0PTuPtMSbesqiQJFxc3+9Tejhy35FcVp0nbvWsCS+PhxOJwZDoeTn37+nCbknoki5tm7C/VKuSAsC3kUZ8t3F//8GLwdX5BC0iyiCc/Yu4sHVlz8fP3Xv/y0nkY8LFOWSQIQWTFd5+G7i5WU+XQ0KsIVS2lxlcah4AVfyKuQpyO+WMQhG625iEaaoirVWy54yIoCxnNpdk+LiwYu/DwMLRJ0DZ0R0BiFKyok+7zFUJ8MYo4mo/E+kHYGEMxQU/eh9CdDWSOkag/IOAsIqNpDMs9DOjA56zwkbR/JPg9J30can4e0J07pvoDznGVQueAipRI+xXKUUvGpzN8CcE5lPI+TWD4ApmK1MDTOPp1BEfTaIKR69GQEe5TyiCV61KLwdxelyKZN/7eb/kj6tO7fPDY9WDJsWBhuMmKfZVLItq8Ywru6u9cYloprI8ES4CPPilWcb6xDei4aVK5akPtTDLhPk7bdOlcHqtox0+bVy7AFHEJ+s3ZpUlN+GlFVBqwmQmx6DCGhP2ZLSQoSvB34LNZ0mKsOND4tgLYHYIVs4GbRYowbjFG41W7EiQeqVYtTrwrixFvGqgNt4C4xHYCofBKEprd04AO7d7CKSEarp8G1azTCvlTSFS02SlMjLgYaghbR6CDWApbwcGPPEJM9jWnmBvAh7axhvnyeor4XvMy3aPHz0G62JnuNztMTsBqF7xqh4nnE3K1oDpY8Dac3y4wLOk+AIlBfAhpIqhXAXxBkfFSv7HNVjvLTvCwSfIlKgibx4hqcwDmPHvCZQ4UxzamgN6BDSmAoge6BM4mlsIVKLLUmE9dRZrARrqfgcEYfoCGIv2F6403RrcBCU7Fs09sUemxBy0TuN7/tNK6ouBX4KHIawoyhEV1IBojAT+ySxLgKml1RgB8fSmQCLSW/GGFHUfefw8eo+RptUKsfee0UBTC0cnw/sJwLSe5YiBsUUafkrkxh/3/AXrLGqBH2WWRMPEsHjvRZZDf/eiw6zo1+TcWNmaGaY6XLjROTOkyaPgkmljbbIU0xdNub2X6PtGa0/urtFHbo7dfs0nuMWuTlP0oJMs4IrbjPoh6H4adLlKGY6mxcQx5EQ5WqhAQWPxesYOKeXVyTAZj9iXYGktc/unc++UH720DKXoYImhFau5xEckLzPHmA89wSRJ0J1IiIFfEywzowDFEZMlLwpKzcKyJXVJKUMUmKnIXxImYRgX5RQdaxXJEQ2sQRE5UzRviC5OU8iUOyYjSRq0tS0AWTD5cEzopkzZIFFQw+CnxP8LlM+JwmlyQEWSgFvhU8jPHJsvtY8AxVCj8RgMFoHMwbWdBQclEMUCgtMDxQqB2bc1ChvpjUVkZjR68VXVesyaxPhqo7uurr6nPIMF1Dnz1D2U8rmHt3WvI0VddPqNS1v9v9yer3w0votK6oA2RHUSaqEVjOa8rOsEU7TK+lOophTXAf69BrmDPH8I3ghS20vP6NSRGHp5ZLVQwvMGujdGRlbrJCijqA9PEhZ4fE50jX6RAj2UhlUdAhu7Hpuoqrmjta++rGw5q41sycaU8nY/gSHiS85tZ7TpNiOkRfbN0ESXtVW/sI8UO208OT0XTFdkx/R5leTfnzO/mQgO89vadwqPo1LuQtELYUNF/VIpKVad0yTu6Ttl0jPlB3E7VlKpaNOh3O9oNh90U+lDS520Bsh21t0xnr8ZGTYsXXBKNjTLIsRIeBFLKM0A6kZQHOR8gF+HmSJIzC51Arc20rTzAhbwj4MHLFhsPXjieaq2NdDijU1QDxAxkztLGJrsH/xe+VxA9XnjcnihX4pnPGMnB95eVzxO2EHLxBfxkHbSS9aES9rwpDpEX39dlkZuIprOteGlYQeP5L7vxPZfUdTXOQqyL+g53erzXPCHy7YZT5BK4esfgti4dsY4FrGJ71qqp3YNe3x95EG7vf/m76gRUAXOys5xFB9QJPN8dI/tfkrW4GM8McuwPIaNT7wIj9mmrEji344oZUe31DWmvfXbX1RkC6iOdVVODgQst50jyas9c86c39I8YW34s4qomA6n9D1RpHhacEZ79LI1TfYMgAG9hap0n0mW5a/Mr5pw3thlO1WsSikB/4GncenD9tvraVLk/KFK+12/q2oGqS8V9mNEMzUH/9q/5qt7Hu9HAy+LqEJ2DUxKogVzWBvWJNsVvudnrKns3bCFT3CKLaY8110YafkNSPlXJ0d6Kw/m1oDRtWV8TtshJJahruGELdsX03wB5fW0vOlvW4EqKELZCYs8T/lokQY1DL/mG0FvuKdycYXi37YIabru44E22IdfwTM/z3Mp0zgb7RiU27YTw+6m6PapLi+YY1cR450L2QJjnmLNDdhqL/1YVVFeXNW1t58+J6BHuBbpvOTsBEV3xbGVtb3p5md+OBfr/sNsZfRG80G4oMy/gqeuPPTPg/JAjzJ9abGUvgRPgaimO5yti1nd2jj68EjmNhGHQIvwNHCwJ0rb9XfmuP6g0+and393gzM/VAPyNS+xpRm3ai9Yz21t4zLE33du53TVODcSb6c2g/YElfMuL01Q5KOwZ33Y9onGJa1f+RyEUdAo1ORk28iQEeew13IhY1iBwMTwlC5/yeYVhUlHMRh+THXcy67cR65lj9C/LDEqpbnqP5wc5ZyPBd1QmqrJJHRuxflXYltOHbn15C23yJNS0wsDmA59bMmLjeeGf3V4Kx6xtq/+J6h72P8XzQxfX3z/PDWn2z2ESacS0yjjkW8pKsMdsiXNFsyYoqzQKTMuaMpDRi+HpSy2xrYk4ahTp8c3qdFaVgdU7Hxq6EFKPcTEJxXGzIiuubkEUpocfPQ43OERv2uzNA1JSJ6YNEDDr99tPDTmeC6YoauH5Xqs5c+j11Op70pU1Jp3J7qT2ADbbrWdrssYhPxYadzJ8OG/o1FRs6N+BfmA0B7BOV7NAC84hwnpfkgZeEoqxxshaxZASkjOG9e5WCFEUgHAWmGy0wD5FnNCFQkmM2UZWpFIP8Y8oPymCcAqESAwJ4K1ICqdv8pKsh+0ZgzhzLx7l9Hxw9rEVg+SRmE/rA6xD4hew5zcABvMGkWVPXduy75ftjZaz3vb5vgjdVPJdlEQNX6JYu2Uww+qkyy/LaY0Uo4jnaN0bYYC6BXNFGspC+buMrQn6Bo1fEz4cEYe21jeLFAsoWgqcAyguGjTnAi15KXrdP0Te/RzZqT9MNOGZ9P2ajkmcwlDeVeg+5mbNdy5o5wZBwwDcyR7dJjyTtnW7ferWmLWc8T9glyRPQ+drwgQDkTMiHK7IV6zXvyOlOiuaK3reWErwGXgqy5iKJKiwcfM1IEt+zK4LWmtFwtQG4xPzPegRoOIrxThr9g6a6ugqv/A/aZGs2w2BO5jYls1vWzdzsVEQjPFBUCZ5sW3NF7sq82jwfkOowoXHaJJcKBqrCMmDJEDOvuGpgucYQ/+GbN/M6qEWGfxIBa/n3MloiL4fZc3c8Gc/sITmL34iKeGVl8OrFB4+Bidp5SMFVAJEEg5sAE8ocU3M4lH5iIK9hjKaxEf11nLTCVFvSoqM0KPsIt+YlaEPVPW45+5+Ws1dko6gJW2K6cc9mV7nHjfHPgdowBm0dJJN2oDmmZe0GhCx3YvneTkDtMZ/2y/H+iOiMHd/1nSHXfY+KzpentQDP+lYcJwI9byydOGqbk5wv7/4gddRZ06q0xOkK3s2x0SYFLH+jCCl5jpHpuomIlyu5/ZxzKXm6/a4Di+3XioFhFJsr6gXn1RSbz2Upq89NGDIBw9ZqPLapiiMe4n1ww4XbWIYrjHW0p8l64tVr/Wc1o+0fWV//FwAA//8DAFBLAwQUAAYACAAAACEA1+YInhsBAABEBAAAHAAIAXdvcmQvX3JlbHMvZG9jdW1lbnQueG1sLnJlbHMgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsk81OwzAQhO9IvIO1d+KkQEGoTi8IqVcIElc32fyI2I7sDZC3x6Jqkooq6sHHHWtnPnu9m+2PatkXWtcYLSCJYmCoc1M0uhLwnr3cPAJzJHUhW6NRwIAOtun11eYVW0m+ydVN55h30U5ATdQ9ce7yGpV0kelQ+5PSWCXJl7bincw/ZYV8FcdrbucekJ54sl0hwO6KW2DZ0OEl3qYsmxyfTd4r1HQmgjsaWn8BlklbIQk41JH3AX4+/iFkPPlenNL/yoOYLDGsQjLoXu3R+vFOHKO0BJGEhMh7R0Z9+LQRIoomlTeEavFJ1iFpSqMpk/t2NppRWoK4Dwnxjfs3JPJTmP3PmbgEchd0R/5RHJUjAj/Z/fQXAAD//wMAUEsDBBQABgAIAAAAIQCWta3i8QUAAFAbAAAVAAAAd29yZC90aGVtZS90aGVtZTEueG1s7FlLbxNHHL9X6ncY7R38iB2SCAfFjg0tBKLEUHEc7453B8/urGbGCb5VcKxUqSqteihSbz1UbZFA6oV+mrRULZX4Cv3P7Hq9Y4/BkFSlAh+88/j934+dsS9euhszdESEpDxpebXzVQ+RxOcBTcKWd7PfO7fhIalwEmDGE9LyJkR6l7Y//OAi3lIRiQkC+kRu4ZYXKZVuVSrSh2Usz/OUJLA35CLGCqYirAQCHwPfmFXq1ep6JcY08VCCY2B7YzikPkF9zdLbnjLvMvhKlNQLPhOHmjWxKAw2GNX0Q05khwl0hFnLAzkBP+6Tu8pDDEsFGy2vaj5eZftipSBiagltia5nPjldThCM6oZOhIOCsNZrbF7YLfgbAFOLuG632+nWCn4GgH0fLM10KWMbvY1ae8qzBMqGi7w71Wa1YeNL/NcW8Jvtdru5aeENKBs2FvAb1fXGTt3CG1A2bC7q397pdNYtvAFlw/UFfO/C5nrDxhtQxGgyWkDreBaRKSBDzq444RsA35gmwAxVKWVXRp+oZbkW4ztc9ABggosVTZCapGSIfcB1cDwQFGsBeIvg0k625MuFJS0LSV/QVLW8j1MMFTGDvHj644unj9HJvScn9345uX//5N7PDqorOAnLVM+//+Lvh5+ivx5/9/zBV268LON//+mz33790g1UZeCzrx/98eTRs28+//OHBw74jsCDMrxPYyLRdXKMDngMhjkEkIF4PYp+hGmZYicJJU6wpnGguyqy0NcnmOXRsXBtYnvwloAW4AJeHt+xFD6MxFhRB/BqFFvAPc5ZmwunTVe1rLIXxknoFi7GZdwBxkcu2Z25+HbHKeTyNC1taEQsNfcZhByHJCEK6T0+IsRBdptSy6971Bdc8qFCtylqY+p0SZ8OrGyaEV2hMcRl4lIQ4m35Zu8WanPmYr9LjmwkVAVmLpaEWW68jMcKx06NcczKyGtYRS4lDyfCtxwuFUQ6JIyjbkCkdNHcEBNL3asYepEz7HtsEttIoejIhbyGOS8jd/moE+E4depMk6iM/UiOIEUx2ufKqQS3K0TPIQ44WRruW5RY4X51bd+koaXSLEH0zljkfdvqwDFNXtaOGYV+fNbtGBrgs28f/o8a8Q68k1yVMN9+l+Hmm26Hi4C+/T13F4+TfQJp/r7lvm+572LLXVbPqzbaWW81x+Xpodjwi5eekIeUsUM1YeSaNF1ZgtJBDxbNxBAVB/I0gmEuzsKFApsxElx9QlV0GOEUxNSMhFDmrEOJUi7hGmCWnbz1BrwVVLbWnF4AAY3VHg+y5bXyxbBgY2ahuXxOBa1pBqsKW7twOmG1DLiitJpRbVFaYbJTmnnk3oRqQFhf+2vr9Uw0ZAxmJNB+zxhMw3LmIZIRDkgeI233oiE147cV3KYveatL29RsTyFtlSCVxTWWiJtG7zRRmjKYRUnX7Vw5ssSeoWPQqllvesjHacsbwiEKhnEK/KRuQJiFScvzVW7KK4t53mB3WtaqSw22RKRCql0so4zKbOVELJnpX282tB/OxgBHN1pNi7WN2n+ohXmUQ0uGQ+KrJSuzab7Hx4qIwyg4RgM2FgcY9NapCvYEVMI7w+SangioULMDM7vy8yqY/30mrw7M0gjnPUmX6NTCDG7GhQ5mVlKvmM3p/oammJI/I1PKafyOmaIzF46ta4Ee+nAMEBjpHG15XKiIQxdKI+r3BBwcjCzQC0FZaJUQ0782a13J0axvZTxMQcE5RB3QEAkKnU5FgpB9ldv5Cma1vCvmlZEzyvtMoa5Ms+eAHBHW19W7ru33UDTtJrkjDG4+aPY8d8Yg1IX6tp58srR53ePBTFBGv6qwUtMvvQo2T6fCa75qs461IK7eXPlVm8LlA+kvaNxU+Gx2vu3zA4g+YtMTJYJEPJcdPJAuxWw0AJ2zxUyaZpVJ+LeOUbMQFHLnnF0ujjN0dnFcmnP2y8W9ubPzkeXrch45XF1ZLNFK6SJjZgv/OvHBHZC9CxelMVPS2EfuwlWzM/2/APhkEg3p9j8AAAD//wMAUEsDBBQABgAIAAAAIQD7u/x/EgUAANEPAAARAAAAd29yZC9zZXR0aW5ncy54bWy0V21v2zYQ/j5g/8Hw5znWu2yhTqEXa03RtMOcYp9pibaJSKJAUnHcYf99R0q0nYQp4m79YlP33D13PJ6Op3fvH+tq9IAZJ7RZjO0razzCTUFL0mwX4693+WQ2HnGBmhJVtMGL8QHz8fvrX395t484FgLU+AgoGh7VxWK8E6KNplNe7HCN+BVtcQPghrIaCXhk22mN2H3XTgpat0iQNamIOEwdywrGAw1djDvWRAPFpCYFo5xuhDSJ6GZDCjz8aQv2Fr+9SUaLrsaNUB6nDFcQA234jrRcs9U/ygbgTpM8fG8TD3Wl9fa29Ybt7ikrjxZvCU8atIwWmHM4oLrSAZLm5Nh7QXT0fQW+hy0qKjC3LbU6j9y/jMB5QRAU+PEyjtnAMQXLcx5SXsYTHHnIKbF28GPBnBGU3UUUjqvjkH/S/IyLl6LcXUanz2gqbZFAO8SPFdkzbqrLGL0zxr7AKlrcn3Piy5LmHwkP9ekM+cuwDFXdQ5/ImiHW94yhpOsiutk2lKF1BeFAaY+gOkcqOvkLhyz/1BI/KrnM7bDYVHIBqb+GlvaN0nq0j1rMCnivoR9a1ngqAXib6GYlkADGiLe4qlSDLCqMIIB9tGWohtamJcqmxBvUVeIOrVeCtqD0gGCfoTNQFjvEUCEwW7WoALaUNoLRSuuV9DMVKbRJBm/xYKGa5mm16hswWDSohp0/aaq3tMQyso6Rtx+RNFDebf/c5XNHFC4MRkp8JzO+EocK5xD8inzDcVN+7LggwKha63+I4HsB4EZ6/gI1cndocY6R6CBNP8mZOom8Iu0tYYyym6aE2vhpzshmgxk4IFBrt1A+hNG9yvMHjEq4p3+S347jv0AZXlH3DsryPqFC0PrDod1Brv+Hk5yely9MGyXXiz8pFVrVslLPni3nfaQSPSHW3HGs1IikTuYFRiTzcnvY91PEtrwsH4r8GRK4iZsZkZnnZzMT4oS2ayVGBCJYhibEtew8XRoRxwkzYwRuHLix0Y9nObbrmhHfToxRe7PQs4y59q0g9I0R+KnnJkYkmHneMjYhoeUvQ+MpzOZuEBrPdO5ar7DNY/uVnc7jMLCMGY3jMHYdI5KE8czIlsjyMUaQeLY/G7r4M8S3UnOukzCY+8Zcv17xmefZiXE/2dwLl8a8ZYmfp8bzWULFubkRgbIOjX7y2Mlz5WfaQ/DW1pGcdP9geiVb/6juLVJUrxlBo1s5C0+lxprdJ6TR+BrDhY7PkVW31uBk0gO8RlWVQxPSgEp1HZWEtxneqHV1i9j2xDtoMKMU7uGPRy55r2P2O6Nd26N7htq+pWsV2/MGS9KIT6TWct6tV9qqgRHkDOqa8ssDU3k6pWcfCWiR6mr8hFSrVbq4mXxdyeaIERcxJ2gx/rabpJ/7/BcVW8nOim9R2/YNer21F+OKbHfClmYCnkr4ilIP660zYI7CnB5TD6iQmwXtYXGSOVp2pudqmXuSeVrmnWS+lvknWaBlgZTt4EpmMB/dw12hl1K+oVVF97j8cMJfiPok8B1qcdaPT1BxtBcM8xQfPUT4EYYzXBIBH6ctKWv0KGc1R90Bg3aFDrQTT3QlJpXbpwxyVNa31BNjVfXPYpFjXUGgQleHen2a1q76wCvC4WZtYbATlGnsN4XZXlTS4gZeLlgpue/60DWHtmT7R9jv4b+TJMjmzjKdWLNZOPHiNJ3ES9uZOGGyjD0rSEJ/+c/wbupv8et/AQAA//8DAFBLAwQUAAYACAAAACEAt/GuJK8AAAAOAQAAEwAoAGN1c3RvbVhtbC9pdGVtMS54bWwgoiQAKKAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArI/BCsIwEER/JezdpnoQKW2lIJ5EhCp48JKm2zaQ7JYkiv69QcQv8Dhv4A1Tbp/Oigf6YJgqWGY5CCTNvaGxgst5v9iACFFRrywTVkAM27rsipbvXmMQLVrUEfs2vmyqb82pya7tAcQHHJVLMDEQaYdC0VUwxTgXUgY9oVMh4xkpdQN7p2KKfpQ8DEbjjvXdIUW5yvO17ExnDY9ezdPrK/uLqi7l70z9BgAA//8DAFBLAwQUAAYACAAAACEAL+E+iN8AAABVAQAAGAAoAGN1c3RvbVhtbC9pdGVtUHJvcHMxLnhtbCCiJAAooCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACckMFqwzAMQO+D/YPRPXVWmnYrcUo7J9Dr2KBX11ESQ2wF2xkbY/8+h5264y4ST0J6QuXhw47sHX0w5AQ8rHJg6DS1xvUC3l6b7BFYiMq1aiSHAhzBobq/K9uwb1VUIZLHc0TLUsGkfJYCvopit3la18/Zpjim0EiZnepTk8mtbI6yqHeJvoEltUtrgoAhxmnPedADWhVWNKFLzY68VTGh7zl1ndEoSc8WXeTrPN9yPSe9vdgRquWe3+kX7MItLqfN3vzXcjXX0VDv1TR8Aq9K/ke18M0rqh8AAAD//wMAUEsDBBQABgAIAAAAIQD2ObcZYwUAABpFAAASAAAAd29yZC9udW1iZXJpbmcueG1s7JvbbuM2EIbvC/QdDAG9TESdqAPWWThxXGyxLYo2fQBGom0hoiRQtJ28/ZLUwbZkeyV5k2IB3kQ2D59myJnhDzn69PmVJJMtpkWcpVPNuAXaBKdhFsXpaqr997S48bRJwVAaoSRL8VR7w4X2+e7XXz7tgnRDnjHlAyeckRbBLg+n2pqxPND1IlxjgopbEoc0K7Iluw0zomfLZRxifZfRSDeBAeSnnGYhLgrOeUDpFhVahQtf+9EiinZ8sgDaerhGlOHXPcMYDHF0X/e6IHMEiHtoGl2UNRgFdWFVB2SPAnGrOiRnHOmEc3AcyeyS3HEkq0vyxpE64US6AZ7lOOWdy4wSxPhXutIJoi+b/IaDc8Ti5ziJ2RtnAlhjUJy+jLCIz2oIxIoGE1ydZBFOrKimZFNtQ9Ogmn/TzBemB+X86tLMwEm/2/Lb+Tp+ZUnB6rm0z9qV0+dZuCE4ZXLVdIoTvo5ZWqzjvKkOZCyNd65ryPbSAmxJUo/b5UbPVDtX2ublNuyBfcyv9o4kpeWXiQbosZsC0czoY8LxPWtLCI/g/Y1HLc3B4ho9i08NMDsAGOKeh0XN8CqGHu6zW3DinmlVc8pdEZx4v7BGzxrYNuYAEG0GIUyrtkNcxPQDVhGxaD0MV++RLuYihtaoaJKmJC57FoKaaB8QywBLsrCpZ4KJhy2a0wDfyMEe5qvrEvV3mm3yPS2+jvZlX7J3Qj0NYFUJf1iEiuuM+XeNcl7JSRh8WaUZRc8Jt4in74Rn4ETugPjLA1lc5Ef8KttF/FQflon4EG0moiRqd1wFoueCURSyvzZkcvTtC08lriY5PKCYS0gqGkvBOFsyTO8pRi9iiKCkhbhtsEU8rABYQMDTXNNFD9kkLP6Ktzh5estxPWb99kzj6E/Rl4i+ciwjeVKPmJm+7UP4WPYkW9ER80tpVMDyhB/mwAY+4PeTNkgb6+lGOY9r3AVpGiMcxgRVN+OsJ37C1X2/GbdN+x9h3ZrgJSub87+puMSp8FM0TzXXlKasUbqSctuCQIzVq8G6ZLWtN9rWG75s4QccPyW3WIzo502S7TD9ihnfi9MemYM9Mmx7hEtmx6X7a1z6JyMoPe2RdcojGq/W510yDXjskuH1cMk6EWPjXLoYc/bgHTI9b8QO2R8XdM5gl7gHI1xyPizo4PCgs61WaegVdPBjgs4dvEMOGFMW3I8LOm+4S26rLPRyyfuwoPOHBx20W6XhTNDpR8e8oFzUAOLAGq4BfMu2vblXGqs0wLH1SgNckRlKAygNoDSA0gBtl5QGeD8NIKr7YA1gmN7CmDnz0tixGuDB8x5dZ243S9FsxM+iAXYBrS6LLGWFGBmnTFixRNzxaqgco+SCkgtKLnzfJSUXlFy4MuiUXHg/uSBK4WC5YDlw7tgPs9LYsXJhYXsP9v2sohxuhHpk0DMzlAZQGkBpAKUBlAZQGmC8BhC1Y7AGcJwHF/rulRrAX0ATLBawWYpmI9QjAyUXlFz4/g4puaDkgpILbZeUXHg/uSASbbhcmIGZO7u/8hcGY+Z7Mxf+xI8M3kUu/KCk+T/lwY9JEiUHlBxQckDJgbZLSg68nxwQUTlYDriPtgMfHfULwskwUo8ErsgMpQGUBlAaQGmAtktKA1ylAVJ59qcHLxqI9xeDaCPfbpSNjglc4EC/9O9IJtTWyQf9uuR0oPI/F9tQ07CAB6BvnmfWDpxiyn9v6BgKTI6EJrDOQ+0LUPl7SQcKHcdxget656HyPcszUPlUpQ11AXAM1zQ773/umdYFppRm3W2yXGB5oqCehcpwPAMVKduBep7vmtDpvqi6ZzqHzPJaKsW7bwAAAP//AwBQSwMEFAAGAAgAAAAhAIsTHYqQDAAASXgAAA8AAAB3b3JkL3N0eWxlcy54bWy8nVlz2zgSx9+3ar8DS0+7D4l8yHaSGmfKduK1a+PEEzmTZ4iELGxIQktSPubTLwAeAt0ExQZ7/WJLpPqHo/vfAHj+9vtTEgcPPMuFTE8n+2/3JgFPQxmJ9P508uPu8s27SZAXLI1YLFN+Onnm+eT3j3//22+PH/LiOeZ5oABp/iEJTyerolh/mE7zcMUTlr+Va56qnUuZJaxQX7P7acKyX5v1m1Ama1aIhYhF8Tw92Ns7nlSYbAhFLpci5J9kuEl4Whj7acZjRZRpvhLrvKY9DqE9yixaZzLkea4ancQlL2EibTD7MwBKRJjJXC6Lt6oxVY0MSpnv75lPSbwFHOEABwBwHPInHONdxZgqS5sjIhznuOGIyOL4VcYCRBsU4uCwrof+p80tVh4V0QqHq3001basYCuWr9rEZYwjzixiGWCxDH/ZTI7rtKMG+JxoHybhh+v7VGZsESuSispABVZgwPqv8o/+Zz7yJ7Ndd0v1YRnrD6rXPirpRjL8xJdsExe5/prdZtXX6pv5dynTIg8eP7A8FOJO1VcVmghV/tVZmouJ2sNZXpzlgnXuXOkPnXvCvLA2n4tITKa6xPwvtfOBqW4/OKi3XOgatLbFLL2vt/H0zY+5XRNr00JxTycsezM/04bTqmHlf6u565ffTMFrFgpTDlsWXGUllRQ0NBY6CR6cHNdfvm+0L9imkFUhBlD+b7BT0OMqWanUNS8zqNrLl19UrPBoXqgdpxNTltr44/o2EzJTWfJ08v59tXHOE3Elooin1g/TlYj4zxVPf+Q82m7/49IEYrUhlJtUfT5U1TeVyKPPTyFf67yp9qZM++SrNoj1rzdiW7gx/28N26880WW/4kwPHsH+S4SpPgpxoC1yq7XdzM2LtptfoQo6fK2CZq9V0NFrFWSE8BoFnbxWQe9eqyCD+X8WJNJIjQPm97AYQN3FcagRzXGIDc1xaAnNcUgFzXEoAc1xBDqa44hjNMcRpghOIUNXFFrBfuiI9n7u7jHCj7t7SPDj7h4B/Li7E74fd3d+9+PuTud+3N3Z24+7O1njueVUK7hWMkuL0SpbSlmksuBBwZ/G01iqWGZFTcPTgx7PSBpJgCkzWzUQj6aFzHzfHSFGpP7jeaEXfoFcBktxv8l4PrriPH3gsVzzgEWR4hECM15sMkeP+MR0xpc842nIKQObDqpXgkG6SRYEsblm92QsnkbE3VcTSZJCE9Bq/bzSIhEEQZ2wMJPjqyYZWX74IvLxfaUhwfkmjjkR6ytNiBnW+LWBwYxfGhjM+JWBwYxfGFg+o+qiikbUUxWNqMMqGlG/lfFJ1W8VjajfKhpRv1W08f12J4rYpHh71rE//NjdRSz1OZDR9ZiL+5SpCcD44aY6ZhrcsozdZ2y9CvRR6W6s3WZsOecyeg7uKMa0hkQ1rzchcqFaLdLN+A5t0ajE1fCI5NXwiATW8MZL7EZNk/UE7YpmPTPfLIpO0RrSINHOWbwpJ7Tj1caK8RG2FcClyHIyGXRjCSL4q57OandSZL5tLcdXbMsaL6uXWYm0ehWSoJb6hClNGr56XvNMLct+jSZdyjiWjzyiI86LTJaxZkv+wLhkkOQ/J+sVy4VZK7UQw4f6+uqJ4IatRzfoNmYipfHb5zcJE3FAN4O4urv5EtzJtV5m6o6hAZ7LopAJGbM6EviPn3zxT5oKnqlFcPpM1NozosNDBnYhCAaZkiQjIpKaZopUkIyhhvdv/ryQLItoaLcZL68nKTgRcc6SdTnpINCWyouPKv8QzIYM70+WCX1ciEpUdyQw67Bhvln8h4fjU91XGZAcGfq2KczxRzPVNdZ0uPHThBZu/BTBeFMNDzp+CRrbwo1vbAtH1diLmOW5cJ5C9eZRNbfmUbd3/OKv4slYZstNTNeBNZCsB2sgWRfKeJOkOWWLDY+wwYZH3V7CkDE8gkNyhvevTERkzjAwKk8YGJUbDIzKBwZG6oDxV+hYsPGX6Viw8dfqlDCiKYAFo4oz0uGf6CyPBaOKMwOjijMDo4ozA6OKs8NPAV8u1SSYboixkFQxZyHpBpq04MlaZix7JkJ+jvk9IzhAWtJuM7nUd7LItLyImwCpj1HHhJPtEkfl5J98QVY1zaKsF8ERURbHUhIdW9sOOMbSOnB49H6nmbmTY3QVbmMW8pWMI5452uS2VevleXlbxsvqm2oMOuz5RdyvimC+ao7225jjvZ2W9YK9Zba7wK4+P67vZ+kyu+GR2CR1ReHNFMeHw41NRLeMZ7uNtzOJluXRQEtY5vFuy+0suWV5MtASlvluoKXRacuyTw+fWParMxBO+uKnWeM5gu+kL4oa485i+wKpsewKwZO+KGpJJTgLQ322AHpnmGbc9sPE47bHqMhNwcjJTRmsKzeiT2Df+YPQIzsmaZrymqsnXhZ3aCbRgzLnHxtZHrdvnXAaflPXtZo4pTkPOjmHw09ctbKMux8Hpxs3YnDecSMGJyA3YlAmcpqjUpKbMjg3uRGDk5Qbgc5WcETAZStoj8tW0N4nW0GKT7YaMQtwIwZPB9wItFAhAi3UETMFNwIlVGDuJVRIQQsVItBChQi0UOEEDCdUaI8TKrT3ESqk+AgVUtBChQi0UCECLVSIQAsVItBC9ZzbO829hAopaKFCBFqoEIEWqpkvjhAqtMcJFdr7CBVSfIQKKWihQgRaqBCBFipEoIUKEWihQgRKqMDcS6iQghYqRKCFChFooZa3GvoLFdrjhArtfYQKKT5ChRS0UCECLVSIQAsVItBChQi0UCECJVRg7iVUSEELFSLQQoUItFDNycIRQoX2OKFCex+hQoqPUCEFLVSIQAsVItBChQi0UCECLVSIQAkVmHsJFVLQQoUItFAhoi8+q1OUrsvs9/FHPZ1X7A8/dVVV6rt9K7eNOhyOqmvlZg2/F+Fcyl9B542Hh2a9MQwiFrGQ5hC147S6zTWXRKBOfH676L/Dx6aPfOhSdS+EOWcK4LOhluCYyqwv5G1LsMib9UW6bQlmnbO+7GtbgmFw1pd0jS7ri1LUcASM+9KMZbzvMO/L1pY57OK+HG0Zwh7uy8yWIezgvnxsGR4FOjm/tD4a2E/HzfWlgNAXjhbhxE3oC0voqzodQ2EMdZqbMNR7bsJQN7oJKH86MXjHulFoD7tRfq6GMsO62l+obgLW1ZDg5WqA8Xc1RHm7GqL8XA0TI9bVkIB1tX9ydhO8XA0w/q6GKG9XQ5Sfq+FQhnU1JGBdDQlYV48ckJ0Yf1dDlLerIcrP1XByh3U1JGBdDQlYV0OCl6sBxt/VEOXtaojyczVYJaNdDQlYV0MC1tWQ4OVqgPF3NUR5uxqi+lxtjqK0XI3ysGWOm4RZhrgB2TLEJWfL0GO1ZFl7rpYsgudqCfqq9jlutWQ7zU0Y6j03Yagb3QSUP50YvGPdKLSH3Sg/V+NWS12u9heqm4B1NW615HQ1brXU62rcaqnX1bjVktvVuNVSl6txq6UuV/snZzfBy9W41VKvq3GrpV5X41ZLblfjVktdrsatlrpcjVstdbl65IDsxPi7Grda6nU1brXkdjVutdTlatxqqcvVuNVSl6txqyWnq3GrpV5X41ZLva7GrZbcrsatlrpcjVstdbkat1rqcjVuteR0NW611Otq3Gqp19W41dKNMhEEj4CaJywrArrnxV2xfFWw8Q8n/JFmPJfxA48C2qZ+QbVy+th6/ZVmm1cJqt8Xqs/0E9Ct25Wi8gmwFdD88DpqXlOljXVNguqFYNVmU+HqdK35nOVqTV39Zm/vYrb/7nMV5q4Xftmv+5o1X7pf9+V4Z9rp5E4kPA++8sfgu0yY6e7tm8o6dpp3pnXuCXO42dTfemladbq29dI0s81695npQNjl4Ur1eVg9w8vR5dWzeJubycyTeF86wPHAXlOxrRDrX1ehtY2b8netqCnr76h3oYXfU2eTGHpjpcwdrgq+r6JkVw1VfRZxGQPqw3Wqg+2xCqKyptETK1Fq/wWP4xtW/lqu3T+N+bIo9+7vmUc3vNi/KJ9C6LTPzHDlBEzblSm/9sdJ+V6C6joKpzR1Tu7obnNRz9iedtetlTaa2ugyt/c/vqyUGT22u8teZaqkbzrHgZQCq31YiQ6VbISJD+1dfS1TNVCG+tEST8WGxdVd7laCGSCAdsjrY4igseUoaXZ1NdTWiqO19XMC2i3c35t9uqyu+KBJp7aYzmUW8cwME6VYTKn6OeVVw/9ScxbzQZXJmzcdqonAltxIycu2kZmXdS1CL2OhxoOIX40z/9PPvMwHTfd3pYf6U/7xfwAAAP//AwBQSwMEFAAGAAgAAAAhANyn8URlAQAAIAQAABQAAAB3b3JkL3dlYlNldHRpbmdzLnhtbJzTUW/CIBAA4Pcl+w8N70p1akxja7IsJnve9gMQrpYIXAO46n79oFZX44vdSzna3pcDjtX6qFXyDdZJNDmZjFOSgOEopNnl5OtzM1qSxHlmBFNoICcncGRdPD+tmqyB7Qd4H/50SVCMyzTPSeV9nVHqeAWauTHWYMLHEq1mPkztjmpm94d6xFHXzMutVNKf6DRNF6Rj7CMKlqXk8Ib8oMH4Np9aUEFE4ypZu4vWPKI1aEVtkYNzYT1anT3NpLkyk9kdpCW36LD047CYrqKWCumTtI20+gPmw4DpHbDgcBxmLDuDhsy+I8UwZ3F1pOg5/yumB4jDIGL6cqkjDjG9ZznhRTWMu5wRjbnMs4q56lYs1TBx1hPPDaaQ7/smDNu0+RU86XiGmmfvO4OWbVWQQlcmobGSFo7PcD5xaEM4tu/jtnRBqWIQdq0I9xdrL7X8gQ3aV4uNA0uLFb2518UvAAAA//8DAFBLAwQUAAYACAAAACEApdoeknICAABGCAAAEgAAAHdvcmQvZm9udFRhYmxlLnhtbLyUT3KbMBTG953pHRj2MQJj4niCM9M0nukmiyY5gCyE0UR/GEnY8Rm67D16g96mvUefBNh0nDQhi5qxeTzp/dD79MmXV0+CB1uqDVMyD+MJCgMqiSqY3OThw/3qbB4GxmJZYK4kzcM9NeHV8uOHy92iVNKaAOqlWQiSh5W19SKKDKmowGaiaiphsFRaYAuPehMJrB+b+owoUWPL1owzu48ShLKww+i3UFRZMkI/K9IIKq2vjzTlQFTSVKw2PW33FtpO6aLWilBjoGfBW57ATB4wcXoCEoxoZVRpJ9BMtyKPgvIY+UjwI2A2DpCcADJCn8Yx5h0jgsohhxXjONmBw4oB532LGQCKZhQimfbrcDdXPmCZwhbVOFy/R5GrxRZX2FR/E0s+jpgOiK3BuCKPQyYdJ9rsANwLt4eCLL5spNJ4zYEErgzAWIEHu1/YH3fzIX3yeSdLF5TcBaDasju5wW4hsQDQPRPUBLd0F3xVAks/ocZSGRrDnC0GGZATLENTNEMpfBOI0jByE0mFtaEO1k5EbbrEgvF9n9We6wdqZknV57dYM9dMO2TYBgYas0Z5eIMQSm5Wq7DNxHl4DZnz+exTl0ncu/znostMDxnkMsRz/GPccojnHObAO6NWiRNFrjFna81eUGLlFXBXCjoko5QwO2bMOCXSEyXgDypJz/+LEndM3DWtJTC3t5DrV/z7x7dfP793rZxoFINbEKgT99ezGs2z5zTCjVWjJPJdgCePEiXz+apvfyhRnL0iUeomjTWLAK/gF8zijkt7bNzxGWeW9x0blA3NknqzHDJOieTY97/NcvGaWbrALP8AAAD//wMAUEsDBBQABgAIAAAAIQBtMC69gAEAAOoCAAARAAgBZG9jUHJvcHMvY29yZS54bWwgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8kstOwzAQRfdI/EPkfWo7FYVGaSoegg1ISBSB2Bl7WgyJY9lTQv4eJ2lTghC7edw5Gt9xtvwqi+gTnNeVWRA+YSQCIyulzWZBHlfX8RmJPAqjRFEZWJAGPFnmx0eZtKmsHNy7yoJDDT4KJONTaRfkDdGmlHr5BqXwk6AwobmuXCkwpG5DrZAfYgM0YWxGS0ChBAraAmM7EMkOqeSAtFtXdAAlKRRQgkFP+YTTgxbBlf7Pga7zQ1lqbCz8Kd03B/WX14OwrutJPe2kYX9On+9uH7qnxtq0XkkgeaZkihoLyDN6CEPkt6/vILEvD0mIpQOBlcuv4NWJrruvtF5/QFNXTvkwN8qCTIGXTlsMF+ypo0JQF8LjXTjpWoO6aPLzcAZhopttIbDpcL8E7YyDT93+iZzPOsmQZzuH++1ARcGZtPdx33maXl6trkmeMD6P2Tzmpyt2mibTlLGXdsHR/AFY7jb4l5jMYpbEnK0YT6cnY+Ie0Hs0/p35NwAAAP//AwBQSwMEFAAGAAgAAAAhAGrLGZHjAQAA5AMAABAACAFkb2NQcm9wcy9hcHAueG1sIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnFPLbtswELwX6D8IuseU7NQNDJpB4aDIoW0MWEnOLLWyiVIkQW6MuF/fpRSrdNtTddoZroazD/Lb194URwhRO7su61lVFmCVa7Xdr8vH5vPVTVlElLaVxllYlyeI5a14/45vg/MQUEMsSMLGdXlA9CvGojpAL+OMji2ddC70EgmGPXNdpxXcOfXSg0U2r6olg1cE20J75SfBclRcHfF/RVunkr/41Jw86QneQO+NRBDf0p9m1jrsOZtY3jiUptE9iMWC+AnxrdxDFHPOxoA/u9ASXi45G0O+OcggFVILRf1hXnOWEfyT90YridRd8VWr4KLrsHgYLBdJgLM8hVMZO1AvQeNJVJzlkH/RlhzU5GWMyFuQ+yD9IYpFMjghvlPSwIY6IDppInD2m+D3INN0t1Ing0dcHUGhC0XUP2m+87L4LiOkvq3LowxaWizHtBEMsfERg2g0GtKe8BDmaXmsr0U9JFBwmTiAwQPFl+6GG+JDR7XhP8zWudnBw2g1s5M7O9/xh+rG9V7aE62GpWrOKLX7R3z0jbtLG/LWx0sym/2zxsPOS5Um9PHmOt+C7IjviIWWxjoNZiL4PZURTLqA/rV7aM85fx+kvXoaH62ol7OKvmGRzhxtw/SaxC8AAAD//wMAUEsDBBQABgAIAAAAIQB0Pzl6wgAAACgBAAAeAAgBY3VzdG9tWG1sL19yZWxzL2l0ZW0xLnhtbC5yZWxzIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAjM+xisMwDAbg/eDewWhvnNxQyhGnSyl0O0oOuhpHSUxjy1hqad++5qYrdOgoif/7Ubu9hUVdMbOnaKCpalAYHQ0+TgZ++/1qA4rFxsEuFNHAHRm23edHe8TFSgnx7BOrokQ2MIukb63ZzRgsV5QwlstIOVgpY550su5sJ9Rfdb3W+b8B3ZOpDoOBfBgaUP094Ts2jaN3uCN3CRjlRYV2FxYKp7D8ZCqNqrd5QjHgBcPfqqmKCbpr9dN/3QMAAP//AwBQSwECLQAUAAYACAAAACEA5CSJTH0BAAApBgAAEwAAAAAAAAAAAAAAAAAAAAAAW0NvbnRlbnRfVHlwZXNdLnhtbFBLAQItABQABgAIAAAAIQAekRq37wAAAE4CAAALAAAAAAAAAAAAAAAAALYDAABfcmVscy8ucmVsc1BLAQItABQABgAIAAAAIQBQy797UAsAAKo9AAARAAAAAAAAAAAAAAAAANYGAAB3b3JkL2RvY3VtZW50LnhtbFBLAQItABQABgAIAAAAIQDX5gieGwEAAEQEAAAcAAAAAAAAAAAAAAAAAFUSAAB3b3JkL19yZWxzL2RvY3VtZW50LnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhAJa1reLxBQAAUBsAABUAAAAAAAAAAAAAAAAAshQAAHdvcmQvdGhlbWUvdGhlbWUxLnhtbFBLAQItABQABgAIAAAAIQD7u/x/EgUAANEPAAARAAAAAAAAAAAAAAAAANYaAAB3b3JkL3NldHRpbmdzLnhtbFBLAQItABQABgAIAAAAIQC38a4krwAAAA4BAAATAAAAAAAAAAAAAAAAABcgAABjdXN0b21YbWwvaXRlbTEueG1sUEsBAi0AFAAGAAgAAAAhAC/hPojfAAAAVQEAABgAAAAAAAAAAAAAAAAAHyEAAGN1c3RvbVhtbC9pdGVtUHJvcHMxLnhtbFBLAQItABQABgAIAAAAIQD2ObcZYwUAABpFAAASAAAAAAAAAAAAAAAAAFwiAAB3b3JkL251bWJlcmluZy54bWxQSwECLQAUAAYACAAAACEAixMdipAMAABJeAAADwAAAAAAAAAAAAAAAADvJwAAd29yZC9zdHlsZXMueG1sUEsBAi0AFAAGAAgAAAAhANyn8URlAQAAIAQAABQAAAAAAAAAAAAAAAAArDQAAHdvcmQvd2ViU2V0dGluZ3MueG1sUEsBAi0AFAAGAAgAAAAhAKXaHpJyAgAARggAABIAAAAAAAAAAAAAAAAAQzYAAHdvcmQvZm9udFRhYmxlLnhtbFBLAQItABQABgAIAAAAIQBtMC69gAEAAOoCAAARAAAAAAAAAAAAAAAAAOU4AABkb2NQcm9wcy9jb3JlLnhtbFBLAQItABQABgAIAAAAIQBqyxmR4wEAAOQDAAAQAAAAAAAAAAAAAAAAAJw7AABkb2NQcm9wcy9hcHAueG1sUEsBAi0AFAAGAAgAAAAhAHQ/OXrCAAAAKAEAAB4AAAAAAAAAAAAAAAAAtT4AAGN1c3RvbVhtbC9fcmVscy9pdGVtMS54bWwucmVsc1BLBQYAAAAADwAPANQDAAC7QAAAAAA='''
+
+
+# Regexes used per paragraph/cell while editing documents, compiled once at import
+_RE_THR_STRIP = re.compile(r"[^0-9.]")
+_RE_NUM = re.compile(r"\d+")
+_RE_COURSE_CODE = re.compile(r"[A-Z]{2,4}\s*#\s*\d{3}")
+
+# Static score-table row labels; the threshold-specific variant is added per call
+_COMP_STATIC = frozenset({"100%-70%", "100% - 70%", "70%-100%", "70% - 100%"})
+_BELOW_STATIC = frozenset({"Below 70%", "Below70%", "Below 70 %"})
+
+# Maps Word's non-breaking space and smart punctuation back to plain ASCII
+# before matching, so template quirks don't break the prefix lookups
+_WS_XLATE = str.maketrans({" ": " ", "–": "-", "—": "-", "’": "'"})
+
+
+def _norm(s: str) -> str:
+    # one pass: translate Word quirks, collapse whitespace runs, strip the ends
+    return " ".join(s.translate(_WS_XLATE).split())
+
+
+# I/O
+def load_json_files(glob_pattern: str):
+    files = sorted(glob(glob_pattern))
+    data = []
+    for f in files:
+        try:
+            with open(f, "r", encoding="utf-8") as fh:
+                js = json.load(fh)
+            data.append((f, js))
+        except Exception as e:
+            print(f"Failed to read {f}: {e}")
+    return data
+
+
+def ensure_template_docx(path: str) -> None:
+    """
+    Writes the embedded template DOCX to disk if it doesn't exist.
+    """
+    # one stat covers both the existence and the non-empty check
+    try:
+        if os.stat(path).st_size > 0:
+            return
+    except OSError:
+        pass
+
+    b64_clean = "".join((TEMPLATE_DOCX_B64 or "").split())
+    if not b64_clean:
+        raise RuntimeError(
+            "TEMPLATE_DOCX_B64 is empty. Paste your template DOCX Base64 string into TEMPLATE_DOCX_B64."
+        )
+
+    try:
+        raw = base64.b64decode(b64_clean)
+    except Exception as e:
+        raise RuntimeError(f"Failed to decode TEMPLATE_DOCX_B64: {e}")
+
+    with open(path, "wb") as f:
+        f.write(raw)
+
+
+#JSON NORMALIZATION
+def strip_html(s: str) -> str:
+    if not s:
+        return ""
+    s = html.unescape(s)
+    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.I)
+    s = re.sub(r"<[^>]+>", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def get_outcome_title(js: Dict[str, Any]) -> str:
+    if js.get("outcome_title"):
+        return str(js["outcome_title"]).strip()
+    oi = js.get("outcome_identification") or {}
+    return str(oi.get("title") or "N/A").strip()
+
+
+def get_outcome_long_desc(js: Dict[str, Any]) -> str:
+    if js.get("outcome_long_description"):
+        return strip_html(str(js["outcome_long_description"]))
+    oi = js.get("outcome_identification") or {}
+    return strip_html(str(oi.get("long_description") or oi.get("description") or ""))
+
+
+def get_course_name(js: Dict[str, Any]) -> str:
+    ci = js.get("course_info") or js.get("course_identification") or {}
+    return str(ci.get("name") or "N/A").strip()
+
+
+def get_course_code(js: Dict[str, Any]) -> str:
+    ci = js.get("course_info") or js.get("course_identification") or {}
+    return str(ci.get("course_code") or "N/A").strip()
+
+
+def get_enrollment_count(js: Dict[str, Any]) -> int:
+    ci = js.get("course_info") or js.get("course_identification") or {}
+    enrollments = ci.get("enrollments", [])
+    if isinstance(enrollments, list):
+        for enrollment in enrollments:
+            if isinstance(enrollment, dict) and enrollment.get("type") == "student":
+                amount = enrollment.get("amount")
+                if amount is not None:
+                    try:
+                        return int(amount)
+                    except (ValueError, TypeError):
+                        pass
+    return 0
+
+
+def normalize_course_line_for_template(course_code: str) -> str:
+    """
+    Template wants: 'CSE # 301'
+    If we see 'CSE 301' or 'CSE301' or 'CSE #301', normalize.
+    """
+    s = (course_code or "").strip()
+    m = re.search(r"\b([A-Z]{2,4})\s*#?\s*(\d{3})\b", s)
+    if m:
+        return f"{m.group(1)} # {m.group(2)}"
+    return s if s else "N/A"
+
+
+def get_overall_summary(js: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns normalized overall summary dict with keys:
+      sample_size, number_competent, percent_competent, outcome_met
+    """
+    if isinstance(js.get("assessment_summary"), dict):
+        a = js["assessment_summary"]
+        return {
+            "sample_size": a.get("total_students_assessed"),
+            "number_competent": a.get("number_competent"),
+            "percent_competent": a.get("percent_competent"),
+            "outcome_met": a.get("outcome_met"),
+        }
+
+    r = js.get("results") or {}
+    o = r.get("overall_summary")
+    if isinstance(o, dict):
+        return {
+            "sample_size": o.get("sample_size"),
+            "number_competent": o.get("number_competent"),
+            "percent_competent": o.get("percent_competent"),
+            "outcome_met": o.get("outcome_met"),
+        }
+
+    return {}
+
+
+def get_threshold(js: Dict[str, Any]) -> str:
+    assigns = js.get("contributing_assignments") or []
+    first = assigns[0] if isinstance(assigns, list) and assigns and isinstance(assigns[0], dict) else {}
+    thr = first.get("threshold")
+    if thr is None or thr == "":
+        return "70%"
+    return str(thr).strip()
+
+
+def infer_metric_instrument_type(js: Dict[str, Any]) -> str:
+    assigns = js.get("contributing_assignments") or []
+    first = assigns[0] if isinstance(assigns, list) and assigns and isinstance(assigns[0], dict) else {}
+    explicit = first.get("metric_instrument_type") or first.get("metric")
+    if explicit:
+        return str(explicit).strip()
+
+    name = str(first.get("name") or "").lower()
+    desc = str(first.get("description") or "").lower()
+
+    if "essay" in name or "essay" in desc:
+        return "Essay"
+    if "exam" in name or "exam" in desc:
+        return "Exam"
+    if "quiz" in name or "quiz" in desc:
+        return "Quiz"
+    if "project" in name:
+        return "Project"
+    return "Assignment"
+
+
+@dataclass(frozen=True, slots=True)
+class ReportFacts:
+    """
+    Everything the document edits need from one Canvas JSON, computed once
+    so the getter chains are not re-run by every consumer.
+    """
+    course_name: str
+    course_code: str
+    outcome_title: str
+    outcome_long: str
+    threshold: str
+    enrollment: int
+    metric_type: str
+    sample_size: Any
+    number_comp: Any
+    pct_comp: Any
+    outcome_met: Any
+
+
+def build_report_facts(js: Dict[str, Any]) -> ReportFacts:
+    overall = get_overall_summary(js)
+    return ReportFacts(
+        course_name=get_course_name(js),
+        course_code=get_course_code(js),
+        outcome_title=get_outcome_title(js),
+        outcome_long=get_outcome_long_desc(js),
+        threshold=get_threshold(js),
+        enrollment=get_enrollment_count(js),
+        metric_type=infer_metric_instrument_type(js),
+        sample_size=overall.get("sample_size", "N/A"),
+        number_comp=overall.get("number_competent", "N/A"),
+        pct_comp=overall.get("percent_competent", "N/A"),
+        outcome_met=overall.get("outcome_met", None),
+    )
+
+
+def build_structured_summary(js: Dict[str, Any], facts: ReportFacts) -> str:
+    """
+    Only used to give the LLM context when outcome was not met.
+    """
+    assigns = js.get("contributing_assignments") or []
+    if not isinstance(assigns, list):
+        assigns = []
+    rubric_count = sum(
+        len(a["rubric"]) for a in assigns if isinstance(a, dict) and isinstance(a.get("rubric"), list)
+    )
+
+    lines = [
+        f"Course name: {facts.course_name}",
+        f"Course code: {facts.course_code}",
+        f"Outcome title: {facts.outcome_title}",
+        f"Threshold: {facts.threshold}",
+        f"Sample size: {facts.sample_size}",
+        f"Number competent: {facts.number_comp}",
+        f"Percent competent: {facts.pct_comp}",
+        f"Outcome met: {facts.outcome_met if facts.outcome_met is not None else 'N/A'}",
+        f"Rubric criteria total: {rubric_count}",
+    ]
+    return "\n".join(lines)
+
+
+def get_description_file_contents(js: Dict[str, Any]):
+    """
+    Collect non-empty text values from contributing_assignments[*].description_files_content.
+    """
+    contents = []
+    assigns = js.get("contributing_assignments") or []
+    if not isinstance(assigns, list):
+        return contents
+
+    for a in assigns:
+        if not isinstance(a, dict):
+            continue
+        files_content = a.get("description_files_content")
+        if not isinstance(files_content, dict):
+            continue
+
+        for value in files_content.values():
+            text = str(value or "").strip()
+            if text:
+                contents.append(text)
+
+    return contents
+
+
+def get_section2_sources(js: Dict[str, Any]) -> list[Dict[str, str]]:
+    """
+    Build one Section 2 source block per contributing assignment so each assignment
+    is represented in output.
+    """
+    sources: list[Dict[str, str]] = []
+    assigns = js.get("contributing_assignments") or []
+    if not isinstance(assigns, list):
+        return sources
+
+    for idx, a in enumerate(assigns, start=1):
+        if not isinstance(a, dict):
+            continue
+
+        title = str(a.get("name") or f"Assignment {idx}").strip()
+        parts = []
+
+        desc = strip_html(str(a.get("description") or "")).strip()
+        if desc:
+            parts.append(desc)
+
+        files_content = a.get("description_files_content")
+        if isinstance(files_content, dict):
+            for value in files_content.values():
+                text = str(value or "").strip()
+                if text:
+                    parts.append(text)
+
+        if parts:
+            joined = "\n\n".join(parts).strip()
+            if joined:
+                sources.append({"title": title, "text": joined})
+
+    return sources
+
+
+def is_assessment_section_heading(text: str) -> bool:
+    return bool(re.match(r"^Assessment Report Section\s+\d+\s*:", (text or "").strip()))
+
+
+def insert_paragraph_after(paragraph: Paragraph, text: str, bold: bool = False) -> Paragraph:
+    new_p = OxmlElement("w:p")
+    paragraph._p.addnext(new_p)
+    new_para = Paragraph(new_p, paragraph._parent)
+    run = new_para.add_run(text)
+    if bold:
+        run.bold = True
+    return new_para
+
+
+
+def normalize_section2_source_text(text: str) -> str:
+    """
+    Normalize noisy extraction text before sending to AI:
+    - remove isolated page numbers
+    - collapse excessive whitespace
+    """
+    text = str(text or "")
+    lines = [ln.strip() for ln in text.splitlines()]
+    cleaned_lines = []
+    for ln in lines:
+        if not ln:
+            continue
+        if re.fullmatch(r"\d{1,3}", ln):
+            continue
+        cleaned_lines.append(ln)
+    out = "\n".join(cleaned_lines)
+    out = re.sub(r"[ \t]+", " ", out)
+    out = re.sub(r"\n{3,}", "\n\n", out)
+    return out.strip()
+
+
+def format_section2_with_openai(raw_contents: Iterable[str], js: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """
+    Uses OpenAI to clean and normalize Section 2 content into polished paragraphs.
+    Returns structured blocks for Section 2 rendering.
+    """
+    contents = [normalize_section2_source_text(c) for c in raw_contents if str(c or "").strip()]
+    contents = [c for c in contents if c]
+    if not contents:
+        return []
+
+    client = _get_client()
+    if client is None:
+        return []
+
+    course_name = get_course_name(js)
+    course_code = get_course_code(js)
+    outcome_title = get_outcome_title(js)
+    joined = "\n\n--- SOURCE BLOCK ---\n\n".join(contents)
+
+    user_text = (
+        f"Course: {course_name} ({course_code})\n"
+        f"Outcome: {outcome_title}\n\n"
+        "Format these source blocks for ABET Section 2.\n"
+        "Keep one output block per source block when possible.\n"
+        "Remove the '--- SOURCE BLOCK ---' dividers in the output.\n\n"
+        f"{joined}"
+    )
+
+    try:
+        response = client.responses.create(
+            model=OPENAI_MODEL,
+            input=[
+                {"role": "system", "content": prompt_section2_base},
+                {"role": "user", "content": user_text},
+            ],
+        )
+        out = (response.output_text or "").strip()
+        payload = json.loads(out)
+        blocks = payload.get("blocks", [])
+        formatted = []
+        for b in blocks:
+            if not isinstance(b, dict):
+                continue
+            intro = str(b.get("intro") or "").strip()
+            parts = b.get("parts")
+            closing = str(b.get("closing") or "").strip()
+            if not isinstance(parts, list):
+                continue
+            normalized_parts = []
+            for p in parts:
+                if not isinstance(p, dict):
+                    continue
+                heading = str(p.get("heading") or "").strip()
+                body = str(p.get("body") or "").strip()
+                if not heading or not body:
+                    continue
+                normalized_parts.append({"heading": heading, "body": body})
+            if not intro and not normalized_parts and not closing:
+                continue
+            formatted.append(
+                {
+                    "intro": intro,
+                    "parts": normalized_parts,
+                    "closing": closing,
+                }
+            )
+        if formatted:
+            return formatted
+    except Exception as e:
+        print(f"OpenAI section 2 formatting failed: {e}")
+
+    return []
+
+
+def update_section2_in_doc(doc: Document, js: Dict[str, Any]) -> None:
+    """
+    Rebuild Section 2 with AI-polished content from description_files_content.
+    """
+    sources = get_section2_sources(js)
+    if not sources:
+        return
+
+    heading_text = "Assessment Report Section 2: Assessment Instrument"
+    heading_idx = None
+    for i, p in enumerate(doc.paragraphs):
+        if (p.text or "").strip().startswith(heading_text):
+            heading_idx = i
+            break
+
+    if heading_idx is None:
+        doc.add_paragraph("")
+        heading = doc.add_paragraph(heading_text)
+        if heading.runs:
+            heading.runs[0].bold = True
+    else:
+        heading = doc.paragraphs[heading_idx]
+        to_remove = []
+        for p in doc.paragraphs[heading_idx + 1:]:
+            if is_assessment_section_heading(p.text):
+                break
+            to_remove.append(p)
+        for p in to_remove:
+            p._element.getparent().remove(p._element)
+
+    anchor = heading
+    show_assignment_titles = len(sources) > 1
+    for src in sources:
+        # Process each assignment independently to preserve one block per assignment.
+        formatted_blocks = format_section2_with_openai([src["text"]], js)
+
+        if show_assignment_titles:
+            anchor = insert_paragraph_after(anchor, "")
+            anchor = insert_paragraph_after(anchor, src["title"])
+            anchor = insert_paragraph_after(anchor, "")
+
+        if formatted_blocks:
+            block = formatted_blocks[0]
+            intro = str(block.get("intro") or "").strip()
+            parts = block.get("parts") or []
+            closing = str(block.get("closing") or "").strip()
+
+            if intro:
+                anchor = insert_paragraph_after(anchor, intro)
+                anchor = insert_paragraph_after(anchor, "")
+
+            for p in parts:
+                heading_text = str(p.get("heading") or "").strip()
+                body_text = str(p.get("body") or "").strip()
+                if not heading_text or not body_text:
+                    continue
+                anchor = insert_paragraph_after(anchor, heading_text)
+                anchor = insert_paragraph_after(anchor, "")
+                anchor = insert_paragraph_after(anchor, body_text)
+                anchor = insert_paragraph_after(anchor, "")
+
+            if closing:
+                anchor = insert_paragraph_after(anchor, closing)
+                anchor = insert_paragraph_after(anchor, "")
+            continue
+
+        # Fallback layout if AI unavailable/failed.
+        fallback = normalize_section2_source_text(src["text"])
+        if fallback:
+            for ln in fallback.splitlines():
+                clean_ln = ln.strip()
+                if not clean_ln:
+                    continue
+                anchor = insert_paragraph_after(anchor, clean_ln)
+
+
+# OPENAI (FEEDBACK ONLY)
+_OPENAI_CLIENT = None
+
+# how many feedback requests may be in flight at once
+MAX_CONCURRENT_FEEDBACK_CALLS = 8
+
+
+def _clean_api_key() -> Optional[str]:
+    api_key = os.getenv("OPENAI_API_KEY")
+    # sanitize common .env formatting issues (surrounding quotes, stray spaces)
+    if api_key:
+        api_key = api_key.strip().strip('"').strip("'")
+    return api_key or None
+
+
+def _get_client() -> Optional[OpenAI]:
+    """
+    Lazily build one shared OpenAI client so its HTTP connection pool (and
+    TLS handshake) is reused across calls instead of rebuilt per request.
+    """
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        api_key = _clean_api_key()
+        if not api_key:
+            return None
+        _OPENAI_CLIENT = OpenAI(api_key=api_key)
+    return _OPENAI_CLIENT
+
+
+async def _feedback_one(client: AsyncOpenAI, sem: asyncio.Semaphore, summary_text: str) -> str:
+    async with sem:
+        try:
+            response = await client.responses.create(
+                model=OPENAI_MODEL,
+                input=[
+                    {"role": "system", "content": prompt_base},
+                    {"role": "user", "content": summary_text},
+                ],
+            )
+            out = response.output_text
+            if not out:
+                return "NA"
+            return out.strip() or "NA"
+        except Exception as e:
+            print(f"OpenAI call failed: {e}")
+            return "NA"
+
+
+async def _run_feedback_batch(summaries: Dict[str, str], api_key: str) -> Dict[str, str]:
+    client = AsyncOpenAI(api_key=api_key)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FEEDBACK_CALLS)
+    paths = list(summaries)
+    try:
+        results = await asyncio.gather(*(_feedback_one(client, sem, summaries[p]) for p in paths))
+    finally:
+        await client.close()
+    return dict(zip(paths, results))
+
+
+def generate_feedback_batch(summaries: Dict[str, str]) -> Dict[str, str]:
+    """
+    Generate feedback for all 'outcome not met' summaries concurrently.
+    Returns {json_path: feedback_text}; failures fall back to 'NA'.
+    """
+    if not summaries:
+        return {}
+
+    api_key = _clean_api_key()
+    if not api_key:
+        print("OPENAI_API_KEY not set; skipping OpenAI feedback and returning 'NA'.")
+        return {path: "NA" for path in summaries}
+
+    return asyncio.run(_run_feedback_batch(summaries, api_key))
+
+
+def generate_feedback_with_openai(summary_text: str) -> str:
+    client = _get_client()
+    if client is None:
+        print("OPENAI_API_KEY not set; skipping OpenAI feedback and returning 'NA'.")
+        return "NA"
+
+    try:
+        response = client.responses.create(
+            model=OPENAI_MODEL,
+            input=[
+                {"role": "system", "content": prompt_base},
+                {"role": "user", "content": summary_text},
+            ],
+        )
+        out = response.output_text
+        if not out:
+            return "NA"
+        return out.strip() or "NA"
+    except Exception as e:
+        print(f"OpenAI call failed: {e}")
+        return "NA"
+
+
+# DOCX EDITING (PRESERVE TEMPLATE FORMATTING)
+def replace_paragraph_text_preserve_style(p, new_text: str) -> None:
+    """
+    Replaces paragraph text while preserving formatting of the first run (best effort).
+    """
+    if p.runs:
+        # clone the first run's raw w:rPr once instead of reading and
+        # re-writing every font property through the python-docx layer
+        rPr = p.runs[0]._r.find(qn("w:rPr"))
+        for r in p.runs:
+            r.text = ""
+        run = p.add_run(new_text)
+        if rPr is not None:
+            run._r.insert(0, copy.deepcopy(rPr))
+        return
+
+    p.add_run(new_text)
+
+
+def collect_doc_contents(doc: Document):
+    """
+    Walk the document tree once and return (paragraphs, table_rows):
+    paragraphs covers the body AND all table cells, table_rows is the
+    per-row cell snapshot so table edits don't re-descend the tree.
+    """
+    paragraphs = list(doc.paragraphs)
+    table_rows = []
+    for table in doc.tables:
+        for tr in table._tbl.tr_lst:
+            cells = [_Cell(tc, table) for tc in tr.tc_lst]
+            table_rows.append(cells)
+            for cell in cells:
+                paragraphs.extend(cell.paragraphs)
+    return paragraphs, table_rows
+
+
+def safe_int(x) -> Optional[int]:
+    try:
+        if x is None:
+            return None
+        if isinstance(x, bool):
+            return None
+        if isinstance(x, (int, float)):
+            return int(x)
+        s = str(x).strip()
+        if s == "":
+            return None
+        return int(float(s))
+    except Exception:
+        return None
+
+
+def _cell_text_fast(tc_element) -> str:
+    # lxml concatenates the w:t nodes in C; no per-run Python iteration
+    return _norm("".join(tc_element.itertext()))
+
+
+def update_score_distribution_table(doc: Document, thr: str, sample_size, number_competent, table_rows=None) -> None:
+    """
+    Expected template labels (from your template):
+      - "100%-70%"  
+      - "Below 70%"
+    """
+    n_total = safe_int(sample_size)
+    n_comp = safe_int(number_competent)
+    if n_total is None or n_comp is None:
+        return
+    n_below = max(0, n_total - n_comp)
+
+    # normalize threshold like "70%" -> "70"
+    thr_num = _RE_THR_STRIP.sub("", str(thr))
+    thr_label = f"Below {thr_num}%" if thr_num else "Below 70%"
+    comp_label = f"100%-{thr_num}%" if thr_num else "100%-70%"
+
+    label_variants = {
+        "competent": _COMP_STATIC | {comp_label},
+        "below": _BELOW_STATIC | {thr_label},
+    }
+
+    # Build the cells straight from the lxml elements; table.rows/row.cells
+    # re-walk the XML tree on every property access. The caller usually hands
+    # us the snapshot it already collected.
+    if table_rows is None:
+        table_rows = []
+        for table in doc.tables:
+            for tr in table._tbl.tr_lst:
+                table_rows.append([_Cell(tc, table) for tc in tr.tc_lst])
+
+    for cells in table_rows:
+        texts = [_cell_text_fast(c._tc) for c in cells]
+
+        # find which row this is
+        row_type = None
+        for t in texts:
+            if t in label_variants["competent"]:
+                row_type = "competent"
+                break
+            if t in label_variants["below"]:
+                row_type = "below"
+                break
+        if not row_type:
+            continue
+
+        # Strategy: write into the first purely-numeric-looking cell OR the cell immediately right of the label.
+        # 1) find label cell index
+        label_idx = None
+        for i, t in enumerate(texts):
+            if row_type == "competent" and t in label_variants["competent"]:
+                label_idx = i
+                break
+            if row_type == "below" and t in label_variants["below"]:
+                label_idx = i
+                break
+
+        new_val = str(n_comp if row_type == "competent" else n_below)
+
+        # 2) try numeric cell
+        wrote = False
+        for i, t in enumerate(texts):
+            if _RE_NUM.fullmatch(t):
+                # replace all paragraphs in that cell with a single preserved-style paragraph
+                cell = cells[i]
+                if cell.paragraphs:
+                    replace_paragraph_text_preserve_style(cell.paragraphs[0], new_val)
+                    for extra in cell.paragraphs[1:]:
+                        replace_paragraph_text_preserve_style(extra, "")
+                else:
+                    cell.add_paragraph(new_val)
+                wrote = True
+                break
+
+        # 3) fallback: cell right of label
+        if not wrote and label_idx is not None and label_idx + 1 < len(cells):
+            cell = cells[label_idx + 1]
+            if cell.paragraphs:
+                replace_paragraph_text_preserve_style(cell.paragraphs[0], new_val)
+                for extra in cell.paragraphs[1:]:
+                    replace_paragraph_text_preserve_style(extra, "")
+            else:
+                cell.add_paragraph(new_val)
+
+
+def update_section1_in_doc(doc: Document, facts: ReportFacts, feedback_text: Optional[str]) -> None:
+    # nothing reportable in this JSON -> skip the whole document walk
+    if facts.outcome_title in (None, "", "N/A") and facts.sample_size == "N/A" and facts.number_comp == "N/A":
+        print("No reportable data in JSON; leaving section 1 untouched.")
+        return
+
+    outcome_title = facts.outcome_title
+    outcome_long = facts.outcome_long
+    if outcome_long:
+        outcome_line = f"Outcome assessed ({outcome_title}) {outcome_long}"
+    else:
+        outcome_line = f"Outcome assessed ({outcome_title})"
+
+    class_line = normalize_course_line_for_template(facts.course_code)
+    metric_line = f"Metric Instrument Type: {facts.metric_type}"
+    thr = facts.threshold
+
+    enrollment_line = f"Class Enrollment: {facts.enrollment} students"
+
+    sample_size = facts.sample_size
+    number_comp = facts.number_comp
+    pct_comp = facts.pct_comp
+    outcome_met = facts.outcome_met
+
+    sample_line = f"Sample size: {sample_size} students"
+
+    if isinstance(number_comp, (int, float)) and (pct_comp is not None):
+        comp_summary = f"{int(number_comp)} students scored {thr} or above on rubric ({pct_comp}%)"
+    else:
+        comp_summary = f"N/A students scored {thr} or above on rubric (N/A%)"
+
+    if outcome_met is True:
+        outcome_status_line = "Outcome was met"
+        changes_tail = "NA"
+    elif outcome_met is False:
+        outcome_status_line = "Outcome was not met"
+        changes_tail = (feedback_text or "NA").strip() or "NA"
+    else:
+        outcome_status_line = "Outcome was N/A"
+        changes_tail = "NA"
+
+    changes_prefix = (
+        "If outcome was not met, what changes need to be made to ensure that students can meet this outcome in the future?"
+    )
+    changes_line_full = f"{changes_prefix} {changes_tail}"
+
+    # Replace by matching existing template lines across body + tables.
+    # One prefix table instead of a cascade of startswith tests per paragraph.
+    prefix_replacements = {
+        "Outcome assessed": outcome_line,
+        "Metric Instrument Type:": metric_line,
+        "Class Enrollment:": enrollment_line,
+        "To show competency, a student must score at least": (
+            f"To show competency, a student must score at least {thr} on the assessment."
+        ),
+        "To show the outcome has been met,": (
+            f"To show the outcome has been met, {thr} of the students must show competency."
+        ),
+        "Sample size:": sample_line,
+        "Outcome was": outcome_status_line,
+        changes_prefix: changes_line_full,
+    }
+
+    paragraphs, table_rows = collect_doc_contents(doc)
+
+    # each template field occurs once, so stop walking as soon as all are filled
+    pending = set(prefix_replacements)
+    pending.add("course_code")
+    pending.add("scored_summary")
+
+    # bind the hot callables once; LOAD_FAST is cheaper than LOAD_GLOBAL in
+    # a loop that can cover thousands of paragraphs
+    _replace = replace_paragraph_text_preserve_style
+    _course_code_match = _RE_COURSE_CODE.fullmatch
+    _normalize = _norm
+
+    for p in paragraphs:
+        t = _normalize(p.text or "")
+
+        key = next((k for k in prefix_replacements if k in pending and t.startswith(k)), None)
+        if key is not None:
+            _replace(p, prefix_replacements[key])
+            pending.discard(key)
+            if not pending:
+                break
+            continue
+
+        if "course_code" in pending and _course_code_match(t):
+            _replace(p, class_line)
+            pending.discard("course_code")
+            if not pending:
+                break
+            continue
+
+        if "scored_summary" in pending and "students scored" in t and "or above on rubric" in t:
+            _replace(p, comp_summary)
+            pending.discard("scored_summary")
+            if not pending:
+                break
+            continue
+
+    update_score_distribution_table(doc, thr, sample_size, number_comp, table_rows)
+    #update_section2_in_doc(doc, js)
+    
+
+
+# Per-worker template document, parsed once by _init_render_worker.
+_worker_template_doc = None
+
+
+def _init_render_worker(template_bytes: bytes) -> None:
+    global _worker_template_doc
+    _worker_template_doc = Document(BytesIO(template_bytes))
+
+
+def render_one(path: str, js: Dict[str, Any], facts: ReportFacts, feedback_text: Optional[str]) -> str:
+    """
+    Render one JSON into its DOCX report. Runs in a worker process so the
+    CPU-bound lxml edits + save use all cores; the template DOM is parsed
+    once per worker and deep-copied per report.
+    """
+    base = Path(path).stem
+    doc = copy.deepcopy(_worker_template_doc)
+    update_section1_in_doc(doc, facts, feedback_text)
+    update_section2_in_doc(doc, js)
+
+    out_path = os.path.join(out_dir, f"{base}_ABET_Report.docx")
+    doc.save(out_path)
+    return out_path
+
+
+# main
+def main():
+    ensure_template_docx(template_path)
+
+    # read the template once; workers rebuild their Document from these bytes
+    with open(template_path, "rb") as fh:
+        template_bytes = fh.read()
+
+    data = load_json_files(json_input_glob)
+
+    # fire all "outcome not met" feedback requests concurrently up front
+    prepared = []
+    need_feedback = {}
+    for path, js in data:
+        facts = build_report_facts(js)
+        prepared.append((path, js, facts))
+        if facts.outcome_met is False:
+            need_feedback[path] = build_structured_summary(js, facts)
+
+    fb_map = generate_feedback_batch(need_feedback)
+
+    # stream summary rows as they are built; partial output survives a crash
+    jobs = []
+    csv_fh = None
+    writer = None
+    try:
+        for path, js, facts in prepared:
+            base = Path(path).stem
+            print(f"\nProcessing {base} ...")
+
+            jobs.append((path, js, facts, fb_map.get(path)))
+
+            ca = js.get("contributing_assignments", []) or []
+            rec = {
+                "input_file": path,
+                "contributing_assignments": len(ca) if isinstance(ca, list) else 0,
+                "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            if writer is None:
+                csv_fh = open(output_csv, "w", newline="", encoding="utf-8")
+                writer = csv.DictWriter(csv_fh, fieldnames=rec.keys())
+                writer.writeheader()
+            writer.writerow(rec)
+    finally:
+        if csv_fh is not None:
+            csv_fh.close()
+
+    if writer is not None:
+        print(f"\nSummary CSV written: {output_csv}")
+
+    # document rendering is CPU-bound, so it fans out across processes
+    if jobs:
+        with ProcessPoolExecutor(initializer=_init_render_worker, initargs=(template_bytes,)) as pool:
+            futures = [
+                pool.submit(render_one, path, js, facts, feedback_text)
+                for path, js, facts, feedback_text in jobs
+            ]
+            for future in futures:
+                print(f"Word report saved → {future.result()}")
+
+
+if __name__ == "__main__":
+    main()
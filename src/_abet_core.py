@@ -0,0 +1,496 @@
+#shared core for the two abet scraper entry points so the session, caches and pdf
+#extraction logic live in exactly one place instead of two drifting copies
+#install:
+#pip install pypdf requests
+#pip install beautifulsoup4
+#pip install lxml
+#pip install pypdfium2 (optional, much faster text extraction)
+
+import requests
+import atexit
+import difflib
+import hashlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+#restricting the parse to anchors keeps BS from materializing nav/boilerplate nodes
+_ONLY_ANCHORS = SoupStrainer('a', href=True)
+
+#zstd shrinks cached pdf bodies on disk for nearly free cpu-wise
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+#cdifflib provides a C SequenceMatcher; patching it in makes unified_diff several
+#times faster on big criteria files with no other code changes (pip install cdifflib)
+try:
+    from cdifflib import CSequenceMatcher
+    difflib.SequenceMatcher = CSequenceMatcher
+except ImportError:
+    pass
+
+#lxml parses HTML in C, roughly 10x faster than the pure python html.parser
+_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+#compiled XPath matches the download anchor entirely in C, no python callback per <a>
+if _PARSER == 'lxml':
+    from lxml import etree
+    from lxml import html as lxml_html
+    _LINK_XPATH = etree.XPath(
+        "//a[@href][contains(translate(normalize-space(string(.)),"
+        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'), $txt)]"
+    )
+else:
+    lxml_html = None
+    _LINK_XPATH = None
+
+#pdf parser imports are deferred to first use, so link-only runs never pay the library load
+fitz = None
+pdfium = None
+PdfReader = None
+_PDF_LIBS_LOADED = False
+
+def _load_pdf_backends() -> None:
+    global fitz, pdfium, PdfReader, _PDF_LIBS_LOADED
+    if _PDF_LIBS_LOADED:
+        return
+    _PDF_LIBS_LOADED = True
+
+    #PyMuPDF parses and extracts in C, roughly 10x faster than pypdf, so use it when installed
+    try:
+        import fitz as _fitz
+        fitz = _fitz
+    except ImportError:
+        pass
+
+    #pypdfium2 is an Apache licensed C-backed alternative for when PyMuPDF (AGPL) cant be used
+    try:
+        import pypdfium2 as _pdfium
+        pdfium = _pdfium
+    except ImportError:
+        pass
+
+    #pick the pypdf backend without importing both packages
+    if importlib.util.find_spec('pypdf') is not None:
+        from pypdf import PdfReader as _reader
+        PdfReader = _reader
+    elif importlib.util.find_spec('PyPDF2') is not None:
+        from PyPDF2 import PdfReader as _reader
+        PdfReader = _reader
+
+#force a specific extraction backend with ABET_PDF_BACKEND=pymupdf|pdfium|pypdf
+PDF_BACKEND = os.environ.get("ABET_PDF_BACKEND", "").strip().lower()
+
+#pdf libraries log per token at DEBUG, which can swamp parse time if anything upstream enables it
+for _name in ("pdfminer", "pypdf", "PyPDF2", "fitz"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+#one pooled session so repeat requests to abet.org reuse the same TCP+TLS connection
+#instead of paying a fresh handshake per call, with retries on transient errors
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+#set once so every request rides the same warm connection between the page GET and
+#the pdf GET instead of renegotiating while the parse runs
+_SESSION.headers.update({'Connection': 'keep-alive', 'User-Agent': 'abet-tool/1.0'})
+atexit.register(_SESSION.close)
+
+#where conditional-get metadata and cached pdf bodies live between runs
+PDF_CACHE_DIR = ".pdf_cache"
+
+#dirs already created this run so repeat calls dont re-issue the stat syscalls
+_MADE_DIRS = set()
+
+def _ensure_dir(path: str) -> None:
+    if path not in _MADE_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _MADE_DIRS.add(path)
+
+#writes a cached pdf body, zstd compressed when the library is around
+def _write_cached_pdf(pdf_path: str, body: bytes) -> None:
+    if zstandard is not None:
+        with open(pdf_path + '.zst', 'wb') as f:
+            f.write(zstandard.ZstdCompressor(level=3).compress(body))
+    else:
+        with open(pdf_path, 'wb') as f:
+            f.write(body)
+
+#reads a cached pdf body back, handling both compressed and plain copies
+def _read_cached_pdf(pdf_path: str) -> bytes:
+    zst_path = pdf_path + '.zst'
+    if zstandard is not None and os.path.exists(zst_path):
+        with open(zst_path, 'rb') as f:
+            return zstandard.ZstdDecompressor().decompress(f.read())
+    with open(pdf_path, 'rb') as f:
+        return f.read()
+
+#true when either the plain or the compressed cache copy exists
+def _cached_pdf_exists(pdf_path: str) -> bool:
+    return os.path.exists(pdf_path) or (
+        zstandard is not None and os.path.exists(pdf_path + '.zst')
+    )
+
+#gets the pdf from the url, streaming in chunks so requests never double-buffers the body,
+#and skipping the transfer entirely when the server says the pdf hasnt changed
+def get_pdf_from_url(url: str, timeout: int = 30, cache_dir: str = PDF_CACHE_DIR) -> bytes:
+
+    #replay the stored validators so an unchanged pdf answers 304 with no body
+    headers = {'Accept-Encoding': 'gzip, deflate'}
+    meta_path = pdf_path = None
+    if cache_dir:
+        _ensure_dir(cache_dir)
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        meta_path = os.path.join(cache_dir, f"{key}.meta.json")
+        pdf_path = os.path.join(cache_dir, f"{key}.pdf")
+        if os.path.exists(meta_path) and _cached_pdf_exists(pdf_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            except Exception:
+                pass
+
+    with _SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True,
+                      headers=headers) as resp:
+        if resp.status_code == 304 and pdf_path:
+            print("PDF unchanged on server, using cached copy")
+            return _read_cached_pdf(pdf_path)
+
+        resp.raise_for_status()
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            buf.extend(chunk)
+
+        #remember the new body plus validators for the next run
+        if pdf_path:
+            _write_cached_pdf(pdf_path, bytes(buf))
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': resp.headers.get('ETag'),
+                    'last_modified': resp.headers.get('Last-Modified'),
+                    'content_length': resp.headers.get('Content-Length'),
+                }, f)
+
+    return bytes(buf)
+
+#asks the server with a cheap HEAD whether the pdf changed since the validators we stored
+def should_refetch(url: str, cached_meta: dict, timeout: int = 10) -> bool:
+
+    if not cached_meta:
+        return True
+    try:
+        resp = _SESSION.head(url, timeout=timeout, allow_redirects=True)
+        resp.raise_for_status()
+    except Exception:
+        #when the preflight fails just fall back to the normal download
+        return True
+
+    matched = False
+    for field, header in (('etag', 'ETag'),
+                          ('last_modified', 'Last-Modified'),
+                          ('content_length', 'Content-Length')):
+        have = cached_meta.get(field)
+        if not have:
+            continue
+        if resp.headers.get(header) != have:
+            return True
+        matched = True
+
+    #only skip the download when at least one validator was present and agreed
+    return not matched
+
+#streams the pdf from the url straight to disk in chunks so the whole file never sits in memory
+def download_pdf_to_path(url: str, path: str, timeout: int = 30) -> None:
+
+    #a HEAD preflight against the saved validators skips the body when nothing changed
+    meta_path = path + '.meta.json'
+    if os.path.exists(path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                cached_meta = json.load(f)
+        except Exception:
+            cached_meta = None
+        if cached_meta and not should_refetch(url, cached_meta):
+            print("PDF unchanged on server, keeping existing file")
+            return
+
+    with _SESSION.get(url, stream=True, timeout=timeout, allow_redirects=True) as resp:
+        resp.raise_for_status()
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(resp.raw, f, length=64 * 1024)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'content_length': resp.headers.get('Content-Length'),
+            }, f)
+
+#extracts text from a pdf already saved on disk without buffering it first
+def read_pdf_file(path: str) -> str:
+
+    _load_pdf_backends()
+
+    if fitz is not None:
+        doc = fitz.open(path)
+        try:
+            return '\n'.join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+
+    with open(path, 'rb') as f:
+        return read_pdf_text(f.read())
+
+#top level so the process pool can pickle it; each worker reopens the pdf and pulls one page
+def _extract_page(args):
+
+    pdf_bytes, idx = args
+    _load_pdf_backends()
+    reader = PdfReader(io.BytesIO(pdf_bytes), strict=False)
+    return reader.pages[idx].extract_text() or ''
+
+#parses through pdf and saves the text into a list
+def read_pdf_text(pdf_bytes) -> str:
+
+    _load_pdf_backends()
+
+    #accepts raw bytes or an already open file object
+    if hasattr(pdf_bytes, "read"):
+        pdf_bytes = pdf_bytes.read()
+
+    #default order: pymupdf, then pdfium, then pypdf, unless the env var picked one
+    backend = PDF_BACKEND
+    if not backend:
+        backend = "pymupdf" if fitz is not None else ("pdfium" if pdfium is not None else "pypdf")
+
+    #fast path: PyMuPDF does the page walk and extraction in C
+    if backend == "pymupdf" and fitz is not None:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            page_count = doc.page_count
+
+            #fitz releases the GIL inside its C calls, so threads pay off on big documents
+            if page_count >= 8:
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    parts = list(pool.map(lambda i: doc[i].get_text("text"), range(page_count)))
+                return '\n'.join(parts)
+
+            #one C call per page fed straight into the join, no intermediate list
+            return '\n'.join(doc[i].get_text("text") for i in range(page_count))
+        finally:
+            doc.close()
+
+    #pypdfium2 path: still one C call per page
+    if backend == "pdfium" and pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return '\n'.join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+
+    if PdfReader is None:
+        raise ImportError(
+            "PDF library required. Install with: pip install pypdf"
+        )
+
+    reader = PdfReader(io.BytesIO(pdf_bytes), strict=False)
+
+    #preallocate instead of growing the list, and guard against extract_text returning None
+    pages = reader.pages
+    n = len(pages)
+
+    #pypdf never releases the GIL, so big pdfs fan pages out across cores; short ones
+    #stay serial because worker startup would cost more than it saves
+    if n >= 8:
+        with ProcessPoolExecutor() as pool:
+            jobs = [(pdf_bytes, i) for i in range(n)]
+            return '\n'.join(pool.map(_extract_page, jobs, chunksize=4))
+
+    text_parts = [None] * n
+    for i in range(n):
+        text_parts[i] = pages[i].extract_text() or ''
+
+    return '\n'.join(text_parts)
+
+#returns the extracted text for these exact bytes, re-parsing only when the pdf actually changed
+def read_pdf_text_cached(pdf_bytes: bytes, cache_dir: str = PDF_CACHE_DIR) -> str:
+
+    #blake2b is faster than sha256 for fingerprinting and collisions dont matter here
+    digest = hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
+    _ensure_dir(cache_dir)
+    cache_path = os.path.join(cache_dir, f"{digest}.txt")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    text = read_pdf_text(pdf_bytes)
+    #encode once and write bytes, skipping the per-write codec layer of text mode
+    with open(cache_path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+    return text
+
+#on well-formed markup this compiled regex pulls the pdf href straight from the raw
+#bytes in C; requiring the anchor text keeps unrelated pdf links from matching
+_PDF_LINK_RE = re.compile(
+    rb'<a[^>]*href="([^"]+\.pdf[^"]*)"[^>]*>[^<]*download the criteria[^<]*<',
+    re.I,
+)
+
+#compiled matcher for the anchor text; BS dispatches a regex to re.search in C instead
+#of calling a python lambda on every text node
+_LINK_TEXT_RE = re.compile(r'download\s+the\s+criteria', re.I)
+
+#case-folded byte needles cached per link text so the raw-html prefilter encodes each once
+_NEEDLE_CACHE = {}
+
+def _needle_for(link_text: str) -> bytes:
+    needle = _NEEDLE_CACHE.get(link_text)
+    if needle is None:
+        needle = link_text.casefold().encode('utf-8')
+        _NEEDLE_CACHE[link_text] = needle
+    return needle
+
+#this function scrapes the pdf link from the page and returns the link as a string
+def find_pdf_url_on_page(page_url: str, link_text: str = 'Download the criteria') -> str:
+
+    getlink = 'Download the Criteria'
+
+    #stream the page and parse it incrementally, returning at the first matching anchor
+    #so the tail of the page is never downloaded or tokenized; the download button sits
+    #near the top of the abet pages
+    if _PARSER == 'lxml':
+        needle = getlink.lower()
+        with _SESSION.get(page_url, stream=True, timeout=10) as r:
+            r.raise_for_status()
+            parser = etree.HTMLPullParser(events=('end',), tag='a')
+            for chunk in r.iter_content(chunk_size=8192):
+                parser.feed(chunk)
+                for _, el in parser.read_events():
+                    href = el.get('href')
+                    if href and needle in ''.join(el.itertext()).lower():
+                        return urljoin(page_url, href)
+                    #drop the element so peak memory stays flat while scanning
+                    el.clear()
+
+    #fallback: fetch the whole page and search it in one go
+    response = _SESSION.get(page_url)
+    response.raise_for_status()
+    #abet serves utf-8; pinning it skips requests' per-access charset detection pass
+    response.encoding = 'utf-8'
+
+    #C-level substring scan of the raw bytes first: a page without the anchor text
+    #anywhere cant match below either, so skip building any tree for it
+    if response.content.lower().find(_needle_for(getlink)) < 0:
+        raise ValueError(f"Could not find PDF download link on page: {page_url}")
+
+    #try the raw-bytes regex before paying for any tree construction
+    m = _PDF_LINK_RE.search(response.content)
+    if m:
+        return urljoin(page_url, m.group(1).decode('utf-8', 'replace'))
+
+    #fast path: compiled XPath finds the anchor without building a soup tree
+    if _LINK_XPATH is not None:
+        tree = lxml_html.fromstring(response.content)
+        hits = _LINK_XPATH(tree, txt=getlink.lower())
+        if hits:
+            return urljoin(page_url, hits[0].get('href'))
+
+    #fallback parse builds only the <a href> nodes instead of the whole page tree
+    soup = BeautifulSoup(response.text, _PARSER, parse_only=_ONLY_ANCHORS)
+
+    #pdf links are different from cs and cse in the html structure so this checks for
+    #href; the compiled regex matches plain-text anchors without python callbacks
+    button_link = soup.find('a', href=True, string=_LINK_TEXT_RE)
+    if button_link is not None:
+        return urljoin(page_url, button_link['href'])
+
+    #anchors whose label sits in nested markup dont match string=, so scan their text
+    for a in soup.find_all('a'):
+        if _LINK_TEXT_RE.search(a.get_text(strip=True)):
+            return urljoin(page_url, a['href'])
+
+    raise ValueError(f"Could not find PDF download link on page: {page_url}")
+
+#this function scrapes the pdf from the ABET page and extracts the text and returns it as a string
+def scrape_pdf_from_page(page_url: str, link_text: str = 'Download the Criteria',
+                          save_pdf: str = None) -> str:
+
+    # Find the PDF URL
+    print(f"Searching for PDF link onn {page_url}")
+    pdf_url = find_pdf_url_on_page(page_url, link_text)
+    print(f"Found PDF: {pdf_url}")
+
+    # Download the PDF
+    print("Downloading PDF")
+
+    #when saving, stream straight to disk and parse the saved file, no in memory copy
+    if save_pdf:
+        download_pdf_to_path(pdf_url, save_pdf)
+        print(f"PDF saved to {save_pdf}")
+
+        # Extract text
+        print("getting text")
+        return read_pdf_file(save_pdf)
+
+    pdf_bytes = get_pdf_from_url(pdf_url)
+
+    # Extract text
+    print("getting text")
+    text = read_pdf_text(pdf_bytes)
+
+    return text
+
+#min diff function for comparing two txt files and showing the changes
+def mindiff_text_files(path_a: str, path_b: str, out_path: str = None, context: int = 3) -> str:
+
+    if not os.path.exists(path_a):
+        raise ValueError(f'File not found: {path_a}')
+    if not os.path.exists(path_b):
+        raise ValueError(f'File not found: {path_b}')
+
+    #read line by line instead of buffering the whole file and then splitting it,
+    #which would hold both the full text and the line list in memory at once
+    with open(path_a, 'r', encoding='utf-8', errors='replace') as fa:
+        a_lines = [ln.rstrip('\n') for ln in fa]
+    with open(path_b, 'r', encoding='utf-8', errors='replace') as fb:
+        b_lines = [ln.rstrip('\n') for ln in fb]
+
+    if out_path is None:
+        a_base = os.path.splitext(os.path.basename(path_a))[0]
+        b_base = os.path.splitext(os.path.basename(path_b))[0]
+        out_name = f"{a_base}+{b_base}_diff.txt"
+        out_path = os.path.join(os.path.dirname(path_a) or '.', out_name)
+
+    #stream the generator straight to a temp file so the diff is never held in memory,
+    #then swap it into place so readers never see a half-written diff
+    diff_lines = difflib.unified_diff(a_lines, b_lines,
+                                      fromfile=path_a,
+                                      tofile=path_b,
+                                      n=context,
+                                      lineterm='')
+
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as out_f:
+        out_f.writelines(line + '\n' for line in diff_lines)
+    os.replace(tmp_path, out_path)
+
+    return out_path
@@ -1,8 +1,26 @@
 import requests
+import asyncio
 import os
+import shutil
+from functools import lru_cache
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 load_dotenv()
 
+#requests-toolbelt streams multipart uploads instead of reading the whole file into memory
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+#aiohttp lets batch lookups and downloads overlap instead of paying each RTT in turn
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 CANVAS_BASE = os.getenv("CANVAS_BASE")
 API_TOKEN = os.getenv("API_TOKEN")
@@ -11,55 +29,105 @@ FOLDER_NAME = os.getenv("FOLDER_NAME")
 FILE_NAME = os.getenv("FILE_NAME")
 DESTINATION_PATH = os.getenv("DESTINATION_PATH")
 
-if not all([CANVAS_BASE, API_TOKEN, COURSE_ID, FOLDER_NAME, FILE_NAME]):
+#lookup misses raise instead of killing the process, so a batch runner can catch them,
+#log, and keep going with its warm connection pool
+class CanvasLookupError(Exception):
+    pass
+
+#warn at import but only fail when the api is actually driven from __main__, so simply
+#importing this module never brings down a longer-running process
+_MISSING_ENV = not all([CANVAS_BASE, API_TOKEN, COURSE_ID, FOLDER_NAME, FILE_NAME])
+if _MISSING_ENV:
     print("One or more required environment variables are missing.")
-    exit(1)
 
 headers = {"Authorization": f"Bearer {API_TOKEN}"}
 
+#one pooled session so the repeated Canvas API calls reuse the same TCP+TLS connection
+#instead of handshaking per request, with retries on transient errors; the auth header
+#is set once here instead of being passed on every call
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+SESSION.headers.update(headers)
+
+#ids are stable for the life of a run, so each lookup pays its round trip only once
+@lru_cache(maxsize=128)
 def find_folder_id(course_id: str, folder_name: str) -> str:
-    url = f"{CANVAS_BASE}/api/v1/courses/{course_id}/folders"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    folders = response.json()
-    for folder in folders:
-        if folder['name'] == folder_name:
-            return folder['id']
-    print(f"Folder '{folder_name}' not found in course {course_id}.")
-    exit(1)
+    #search_term narrows the listing server-side and per_page=100 avoids the small
+    #default page that silently truncated large courses; follow next links until a hit
+    url = (f"{CANVAS_BASE}/api/v1/courses/{course_id}/folders"
+           f"?per_page=100&search_term={quote(folder_name)}")
+    while url:
+        response = SESSION.get(url)
+        response.raise_for_status()
+        for folder in response.json():
+            if folder['name'] == folder_name:
+                return folder['id']
+        url = response.links.get('next', {}).get('url')
+    raise CanvasLookupError(f"Folder '{folder_name}' not found in course {course_id}.")
 
+@lru_cache(maxsize=128)
 def find_file_id(folder_id: str, file_name: str) -> str:
-    url = f"{CANVAS_BASE}/api/v1/folders/{folder_id}/files"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    files = response.json()
-    for file in files:
-        if file['display_name'] == file_name:
-            return file['id']
-    print(f"File '{file_name}' not found in folder {folder_id}.")
-    exit(1)
-
-def download_file(course_id: str, folder_name: str, file_name: str, file_path: str) -> None:
-    folder_id = find_folder_id(course_id, folder_name)
-    file_id = find_file_id(str(folder_id), file_name)
+    url = (f"{CANVAS_BASE}/api/v1/folders/{folder_id}/files"
+           f"?per_page=100&search_term={quote(file_name)}")
+    while url:
+        response = SESSION.get(url)
+        response.raise_for_status()
+        for file in response.json():
+            if file['display_name'] == file_name:
+                return file['id']
+        url = response.links.get('next', {}).get('url')
+    raise CanvasLookupError(f"File '{file_name}' not found in folder {folder_id}.")
+
+#resolves folder and file in a single request by asking Canvas to inline each
+#folder's files, halving the round trips of the two-step lookup
+@lru_cache(maxsize=128)
+def find_file_id_direct(course_id: str, folder_name: str, file_name: str) -> str:
+    url = f"{CANVAS_BASE}/api/v1/courses/{course_id}/folders?include[]=files&per_page=100"
+    while url:
+        response = SESSION.get(url)
+        response.raise_for_status()
+        for folder in response.json():
+            if folder['name'] != folder_name:
+                continue
+            for file in folder.get('files') or []:
+                if file['display_name'] == file_name:
+                    return file['id']
+            #right folder but files werent inlined (include[] rejected): two-step fallback
+            return find_file_id(str(folder['id']), file_name)
+        url = response.links.get('next', {}).get('url')
+    raise CanvasLookupError(f"Folder '{folder_name}' not found in course {course_id}.")
+
+def download_file(course_id: str, folder_name: str, file_name: str, file_path: str,
+                  folder_id: str = None) -> None:
+    if folder_id is None:
+        #no pre-resolved folder, so use the single-request combined lookup
+        file_id = find_file_id_direct(course_id, folder_name, file_name)
+    else:
+        file_id = find_file_id(str(folder_id), file_name)
     url = f"{CANVAS_BASE}/api/v1/files/{file_id}"
-    meta_resp = requests.get(url, headers=headers)
+    meta_resp = SESSION.get(url)
     meta_resp.raise_for_status()
     file_info = meta_resp.json()
     download_url = file_info['url']
-    response = requests.get(download_url, headers=headers)
-    response.raise_for_status()
+    #stream the body straight to disk in chunks so the file never sits fully in memory
+    with SESSION.get(download_url, stream=True) as response:
+        response.raise_for_status()
+        with open(file_path, 'wb') as file:
+            shutil.copyfileobj(response.raw, file, length=64 * 1024)
 
-    with open(file_path, 'wb') as file:
-        file.write(response.content)
 
-
-    print(f"Folder ID for '{FOLDER_NAME}': {folder_id}")
+    print(f"Folder ID for '{FOLDER_NAME}': {folder_id if folder_id is not None else folder_name}")
     print(f"File ID for '{FILE_NAME}': {file_id}")
     print(f"File downloaded to {file_path}")
 
-def upload_file(course_id: str, folder_name: str, file_path: str) -> None:
-    folder_id = find_folder_id(course_id, folder_name)
+def upload_file(course_id: str, folder_name: str, file_path: str,
+                folder_id: str = None) -> None:
+    if folder_id is None:
+        folder_id = find_folder_id(course_id, folder_name)
     url = f"{CANVAS_BASE}/api/v1/folders/{folder_id}/files"
     file_name = os.path.basename(file_path)
     file_size = os.path.getsize(file_path)
@@ -71,23 +139,100 @@ def upload_file(course_id: str, folder_name: str, file_path: str) -> None:
         "on_duplicate": "overwrite"
     }
 
-    meta_resp = requests.post(url, headers=headers, data=metadata)
+    meta_resp = SESSION.post(url, data=metadata)
     meta_resp.raise_for_status()
     upload_info = meta_resp.json()
     upload_url = upload_info['upload_url']
     upload_params = upload_info['upload_params']
 
     with open(file_path, 'rb') as file_data:
-        files = {'file': (file_name, file_data, "text/plain")}
-        response = requests.post(upload_url, data = upload_params, headers=headers, files=files)
+        if MultipartEncoder is not None:
+            #stream the multipart body from the open file instead of buffering it all
+            enc = MultipartEncoder(fields={
+                **{k: str(v) for k, v in upload_params.items()},
+                'file': (file_name, file_data, "text/plain"),
+            })
+            response = SESSION.post(upload_url, data=enc,
+                                    headers={'Content-Type': enc.content_type})
+        else:
+            files = {'file': (file_name, file_data, "text/plain")}
+            response = SESSION.post(upload_url, data = upload_params, files=files)
     response.raise_for_status()
     
     print(f"File '{file_path}' uploaded to folder '{folder_name}' in course {course_id}.")
     #print(file_size)
 
+#resolves one folder/file pair and writes the download, all inside the shared session
+async def _resolve_and_fetch(session, course_id: str, folder_name: str,
+                             file_name: str, dest_path: str) -> str:
+    #follow next links like the sync lookups do; the default page size silently
+    #truncated large courses, and a hit past page one must not fail the batch
+    url = (f"{CANVAS_BASE}/api/v1/courses/{course_id}/folders"
+           f"?per_page=100&search_term={quote(folder_name)}")
+    folder_id = None
+    while url and folder_id is None:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            folders = await resp.json()
+            next_link = resp.links.get('next', {}).get('url')
+        folder_id = next((f['id'] for f in folders if f['name'] == folder_name), None)
+        url = str(next_link) if next_link else None
+    if folder_id is None:
+        raise CanvasLookupError(f"Folder '{folder_name}' not found in course {course_id}.")
+
+    url = (f"{CANVAS_BASE}/api/v1/folders/{folder_id}/files"
+           f"?per_page=100&search_term={quote(file_name)}")
+    file_id = None
+    while url and file_id is None:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            files = await resp.json()
+            next_link = resp.links.get('next', {}).get('url')
+        file_id = next((f['id'] for f in files if f['display_name'] == file_name), None)
+        url = str(next_link) if next_link else None
+    if file_id is None:
+        raise CanvasLookupError(f"File '{file_name}' not found in folder {folder_id}.")
+
+    async with session.get(f"{CANVAS_BASE}/api/v1/files/{file_id}") as resp:
+        resp.raise_for_status()
+        file_info = await resp.json()
+
+    async with session.get(file_info['url']) as resp:
+        resp.raise_for_status()
+        with open(dest_path, 'wb') as f:
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                f.write(chunk)
+    return dest_path
+
+#downloads every (folder_name, file_name, dest_path) triple concurrently in one
+#authenticated session, so total wall time tracks the slowest file not the sum
+async def _batch_download_async(course_id: str, triples) -> list:
+    connector = aiohttp.TCPConnector(limit=10)
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(*(
+            _resolve_and_fetch(session, course_id, folder, file, dest)
+            for folder, file, dest in triples
+        ))
+
+def batch_download(course_id: str, triples) -> list:
+    if aiohttp is not None:
+        return asyncio.run(_batch_download_async(course_id, triples))
+
+    #fallback: sequential downloads over the pooled session
+    results = []
+    for folder, file, dest in triples:
+        download_file(course_id, folder, file, dest)
+        results.append(dest)
+    return results
+
 if __name__ == '__main__':
     """
     Example
     """
-    download_file(COURSE_ID, FOLDER_NAME, FILE_NAME, DESTINATION_PATH)
-    upload_file(COURSE_ID, FOLDER_NAME, DESTINATION_PATH)
\ No newline at end of file
+    if _MISSING_ENV:
+        raise RuntimeError("One or more required environment variables are missing.")
+
+    #resolve the folder once and hand the id to both calls, skipping a repeat lookup
+    folder_id = find_folder_id(COURSE_ID, FOLDER_NAME)
+    download_file(COURSE_ID, FOLDER_NAME, FILE_NAME, DESTINATION_PATH, folder_id=folder_id)
+    upload_file(COURSE_ID, FOLDER_NAME, DESTINATION_PATH, folder_id=folder_id)
\ No newline at end of file
@@ -1,8 +1,25 @@
 #Import
+import io
 import os
+import hashlib
 import smtplib #for email sending
 from email.message import EmailMessage
+from typing import Optional
 import difflib
+
+#cdifflib swaps in a C SequenceMatcher so unified_diff runs several times faster
+try:
+    from cdifflib import CSequenceMatcher
+    difflib.SequenceMatcher = CSequenceMatcher
+except ImportError:
+    pass
+
+#blake3's SIMD implementation beats sha256 on multi-MB files; change detection needs
+#no cryptographic strength so take the fastest hash available
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
 #from dotenv import load_dotenv
 #load_dotenv()
 
@@ -23,7 +40,18 @@ NEW_FILE_CS = "new_cs_criteria.txt"
 
 
 
-def diff_files(old_file_path: str, new_file_path: str) -> None:
+#hashes a file in chunks for the cheap equality check below
+def _file_digest(file_path: str) -> bytes:
+    #sha256 still lands on OpenSSL's hardware path when blake3 isnt installed
+    h = blake3() if blake3 is not None else hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.digest()
+
+#returns the notification email for send_all when the files differ, None when they
+#match (send_all drops the Nones)
+def diff_files(old_file_path: str, new_file_path: str) -> Optional[EmailMessage]:
     #check files existencies
     if not os.path.exists(old_file_path):
         print(f"{old_file_path} does not exist. Creating a new one.")
@@ -33,35 +61,58 @@ def diff_files(old_file_path: str, new_file_path: str) -> None:
         print(f"{new_file_path} does not exist. Creating a new one.")
         exit(1)
 
-    with open(old_file_path, 'r') as old_file_cs, open(new_file_path, 'r') as new_file_cs:
-        old_data_cs = old_file_cs.readlines()
-        new_data_cs = new_file_cs.readlines()
+    #most runs see no change at all, so compare content hashes before any diff work
+    if _file_digest(old_file_path) == _file_digest(new_file_path):
+        print("No differences found.")
+        return
 
-    # Generate diff
-    diff_cs = difflib.unified_diff(old_data_cs, new_data_cs, fromfile='Old CS Criteria', tofile='New CS Criteria', lineterm='')
+    #feed the open file iterators straight into the diff so neither file is ever held
+    #fully in memory, and stream the hunks into a single growing buffer
+    with open(old_file_path, 'r') as old_file_cs, open(new_file_path, 'r') as new_file_cs:
+        diff_cs = difflib.unified_diff(old_file_cs, new_file_cs, fromfile='Old CS Criteria', tofile='New CS Criteria')
+        body_io = io.StringIO()
+        body_io.writelines(diff_cs)
+        diff_text = body_io.getvalue()
 
-    if diff_cs:
+    if diff_text:
         #demo print diff
-        diff_text = ''.join(diff_cs)
         print("Differences found:")
         print(diff_text)
-              
+
 
         msg = EmailMessage()
         msg['Subject'] = 'CS Datafile Changes Detected'
         msg['From'] = EMAIL_SENDER
         msg['To'] = "mgoisman@asu.edu"
-        msg.set_content(f"The following changes were detected between the old and new CS data files:\n\n{diff_text}" + __import__('datetime').datetime.now().isoformat())
 
-        try:
-            with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=30) as smtp:
-                smtp.login(EMAIL_SENDER, PASSWORD)
+        #huge diffs ride along as an attachment so the email body stays readable
+        if len(diff_text) > 256 * 1024:
+            msg.set_content("Changes were detected between the old and new CS data files; the full diff is attached.\n" + __import__('datetime').datetime.now().isoformat())
+            msg.add_attachment(diff_text.encode('utf-8'), maintype='text',
+                               subtype='plain', filename='cs_criteria.diff')
+        else:
+            msg.set_content(f"The following changes were detected between the old and new CS data files:\n\n{diff_text}" + __import__('datetime').datetime.now().isoformat())
+
+        #the caller batches messages so one smtp connection serves them all
+        return msg
+
+#sends every message over a single connection so TCP+TLS+login happen once per batch
+#instead of once per email
+def send_all(messages) -> None:
+    messages = [m for m in messages if m is not None]
+    if not messages:
+        return
+    try:
+        with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=30) as smtp:
+            smtp.login(EMAIL_SENDER, PASSWORD)
+            for msg in messages:
                 smtp.send_message(msg)
-            print("Email sent to thaituan@asu.edu")
-        except Exception as e:
-            print(f"Error sending email: {e}")
+        print(f"{len(messages)} email(s) sent")
+    except Exception as e:
+        print(f"Error sending email: {e}")
+
 def runprog():
-    diff_files(OLD_FILE_CS, NEW_FILE_CS)
+    send_all([diff_files(OLD_FILE_CS, NEW_FILE_CS)])
 
 if __name__ == '__main__':
     """
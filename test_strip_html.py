@@ -0,0 +1,50 @@
+#Comparison test pinning strip_html_fast to the regex pipeline it replaced.
+#The divergences this guards against: literal "<>" (not a tag under r"<[^>]+>"),
+#a stray '<' whose pairing '>' belonged to a later <br>, and a '<' that never
+#closes at all - all reachable because strip_html unescapes entities first.
+import random
+import re
+
+import pytest
+
+abetReportGenerator = pytest.importorskip("abetReportGenerator")
+
+
+#the original three-pass implementation, kept here verbatim as the reference
+def _strip_html_reference(s: str) -> str:
+    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.I)
+    s = re.sub(r"<[^>]+>", "", s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+CASES = [
+    "a<>b",                      #empty tag stays literal
+    "x < 10 passes<br>done",     #stray '<' must not pair with the <br>'s '>'
+    "score < 70",                #unterminated '<' keeps the tail
+    "a <b>bold</b> c",
+    "x<br>y",
+    "x <br >y",
+    "trailing <",
+    "  hi   there ",
+    "<>",
+    "<",
+    "<<>",
+    "<a<b>",                     #'<' inside a tag span is content, whole span drops
+    "a< b<c> d",
+    "<b>a",
+    "a<b>>c",
+]
+
+
+@pytest.mark.parametrize("s", CASES)
+def test_matches_old_pipeline(s):
+    assert abetReportGenerator.strip_html_fast(s) == _strip_html_reference(s)
+
+
+def test_fuzz_against_old_pipeline():
+    #seeded so a failure reproduces; alphabet biased toward tag syntax
+    rng = random.Random(1234)
+    alphabet = "<>brBR/ \t\nax&;"
+    for _ in range(5000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert abetReportGenerator.strip_html_fast(s) == _strip_html_reference(s), repr(s)